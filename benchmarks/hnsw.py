@@ -0,0 +1,63 @@
+"""Recall@k and QPS of ``HNSWIndex`` against exact (brute force) search.
+
+Usage:
+
+    python benchmarks/hnsw.py --num-vectors 20000 --dims 128 --k 10 --ef 16 32 64 128
+"""
+import time
+import argparse
+import numpy as np
+
+from deeptxt.core.vector_stores import HNSWIndex
+
+
+def make_dataset(num_vectors: int, num_queries: int, dims: int, seed: int = 0):
+    """Gaussian clusters, closer to real embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(num_vectors // 100, 1), dims))
+    vectors = centers[rng.integers(len(centers), size=num_vectors)] + rng.normal(scale=0.5, size=(num_vectors, dims))
+    queries = centers[rng.integers(len(centers), size=num_queries)] + rng.normal(scale=0.5, size=(num_queries, dims))
+
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def recall_at_k(approx: list, exact: list) -> float:
+    hits = sum(len(set(a.tolist()) & set(e.tolist())) for a, e in zip(approx, exact))
+    return hits / sum(len(e) for e in exact)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-vectors", type=int, default=20000)
+    parser.add_argument("--num-queries", type=int, default=200)
+    parser.add_argument("--dims", type=int, default=128)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--M", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=200)
+    parser.add_argument("--ef", type=int, nargs="+", default=[16, 32, 64, 128])
+    parser.add_argument("--space", choices=["cosine", "ip", "l2"], default="cosine")
+    args = parser.parse_args()
+
+    vectors, queries = make_dataset(args.num_vectors, args.num_queries, args.dims)
+    index = HNSWIndex(dims=args.dims, space=args.space, M=args.M,
+                      ef_construction=args.ef_construction, max_elements=args.num_vectors, seed=0)
+
+    start = time.perf_counter()
+    index.add_items(vectors)
+    build_time = time.perf_counter() - start
+    print(f"build: {args.num_vectors} vectors in {build_time:.1f}s ({args.num_vectors / build_time:.0f} vectors/s)")
+
+    start = time.perf_counter()
+    exact = [index.exact_query(query, k=args.k)[0] for query in queries]
+    exact_qps = len(queries) / (time.perf_counter() - start)
+    print(f"exact: recall@{args.k}=1.000 qps={exact_qps:.0f}")
+
+    for ef in args.ef:
+        start = time.perf_counter()
+        approx = [index.knn_query(query, k=args.k, ef=ef)[0] for query in queries]
+        qps = len(queries) / (time.perf_counter() - start)
+        print(f"hnsw ef={ef}: recall@{args.k}={recall_at_k(approx, exact):.3f} qps={qps:.0f}")
+
+
+if __name__ == "__main__":
+    main()
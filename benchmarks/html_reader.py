@@ -0,0 +1,96 @@
+"""Pages/s of ``HTMLReader`` against LangChain's ``UnstructuredHTMLLoader``, when ``unstructured`` is installed.
+
+Reads the ``.html`` files of ``--input-dir``, e.g. a web crawl, or generates synthetic pages.
+
+Usage:
+
+    python benchmarks/html_reader.py --input-dir ./crawl --limit 100000
+    python benchmarks/html_reader.py --num-pages 10000
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+
+from deeptxt.readers.file import HTMLReader
+
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor incididunt ut labore".split()
+
+
+def make_page(rng: random.Random) -> str:
+    def sentence() -> str:
+        return " ".join(rng.choices(WORDS, k=rng.randint(8, 20))).capitalize() + "."
+
+    sections = []
+    for i in range(rng.randint(2, 6)):
+        paragraphs = "".join(f"<p>{' '.join(sentence() for _ in range(rng.randint(2, 6)))}</p>"
+                             for _ in range(rng.randint(1, 5)))
+        items = "".join(f"<li>{sentence()}</li>" for _ in range(rng.randint(0, 5)))
+        sections.append(f"<section><h2>Section {i}</h2>{paragraphs}<ul>{items}</ul></section>")
+
+    return (f"<!DOCTYPE html><html><head><title>{sentence()}</title>"
+            f"<style>body {{ font-family: sans-serif; }}</style><script>var tracking = {{}};</script></head>"
+            f"<body><nav><a href='/'>Home</a><a href='/about'>About</a></nav>"
+            f"<main><h1>{sentence()}</h1>{''.join(sections)}</main><footer>{sentence()}</footer></body></html>")
+
+
+def make_pages(output_dir: str, num_pages: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    for i in range(num_pages):
+        with open(os.path.join(output_dir, f"page-{i}.html"), "w", encoding="utf-8") as f:
+            f.write(make_page(rng))
+
+
+def list_pages(input_dir: str, limit: int = None) -> list:
+    paths = []
+    for root, _, files in os.walk(input_dir):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith((".html", ".htm")))
+        if limit and len(paths) >= limit:
+            break
+
+    return sorted(paths)[:limit]
+
+
+def run(name: str, load, paths: list) -> None:
+    start = time.perf_counter()
+    num_chars = 0
+    for path in paths:
+        num_chars += sum(len(doc.page_content if hasattr(doc, "page_content") else doc.text) for doc in load(path))
+
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {len(paths)} pages in {elapsed:.1f}s ({len(paths) / elapsed:.0f} pages/s, {num_chars} chars)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input-dir", help="Directory of `.html` files, synthetic pages are generated otherwise.")
+    parser.add_argument("--num-pages", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--unstructured-limit", type=int, default=1000,
+                        help="Number of pages read with UnstructuredHTMLLoader, which is much slower.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_dir = args.input_dir
+        if input_dir is None:
+            input_dir = temp_dir
+            make_pages(input_dir, args.num_pages)
+
+        paths = list_pages(input_dir, args.limit)
+        run("HTMLReader", lambda path: HTMLReader(input_file=path).lazy_load(), paths)
+
+        try:
+            from langchain_community.document_loaders import UnstructuredHTMLLoader
+            import unstructured  # noqa: F401
+        except ImportError:
+            print("UnstructuredHTMLLoader: skipped, `unstructured` package not found")
+            return
+
+        run("UnstructuredHTMLLoader", lambda path: UnstructuredHTMLLoader(file_path=path).load(),
+            paths[:args.unstructured_limit])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Ingest throughput, query latency percentiles, concurrent QPS and recall@k of the vector stores.
+
+Vectors are served by a lookup embedding model, so results only depend on the stores and are deterministic.
+Ground truth is computed by exact search with NumPy. A dataset can be loaded from a ``.npz`` file with
+``vectors`` and ``queries`` arrays, otherwise Gaussian clusters are generated.
+
+Usage:
+
+    python benchmarks/vector_stores.py --stores chroma hnsw --num-vectors 20000 --dims 128 --k 10 --concurrency 1 4 8
+    python benchmarks/vector_stores.py --stores elasticsearch --es-url http://localhost:9200 --es-user elastic --es-password changeme
+"""
+import time
+import argparse
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from hnsw import make_dataset
+from deeptxt.core.document import Document
+from deeptxt.core.embeddings import BaseEmbedding, Embedding
+
+
+class LookupEmbedding(BaseEmbedding):
+    """Stub embedding model returning precomputed vectors for ``doc-<i>`` and ``query-<i>`` texts."""
+
+    def __init__(self, vectors: np.ndarray, queries: np.ndarray) -> None:
+        self._vectors = {"doc": vectors, "query": queries}
+
+    def _lookup(self, text: str) -> Embedding:
+        kind, i = text.rsplit("-", 1)
+        return self._vectors[kind][int(i)].tolist()
+
+    def get_query_embedding(self, query: str) -> Embedding:
+        return self._lookup(query)
+
+    def get_texts_embedding(self, texts: List[str]) -> List[Embedding]:
+        return [self._lookup(text) for text in texts]
+
+    def get_documents_embedding(self, documents: List[Document]) -> List[Embedding]:
+        return [self._lookup(doc.get_content()) for doc in documents]
+
+
+def load_dataset(path: str):
+    with np.load(path) as f:
+        return f["vectors"].astype(np.float32), f["queries"].astype(np.float32)
+
+
+def exact_neighbors(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Exact cosine k-nearest neighbors of each query."""
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+    neighbors = []
+    for start in range(0, len(queries), 256):
+        similarities = queries[start:start + 256] @ vectors.T
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        order = np.argsort(-np.take_along_axis(similarities, top, axis=1), axis=1)
+        neighbors.append(np.take_along_axis(top, order, axis=1))
+
+    return np.concatenate(neighbors)
+
+
+def make_store(name: str, embed_model: BaseEmbedding, args: argparse.Namespace):
+    if name == "chroma":
+        from deeptxt.vector_stores import ChromaVectorStore
+        return ChromaVectorStore(embed_model=embed_model, batch_size=args.batch_size)
+
+    if name == "hnsw":
+        from deeptxt.vector_stores import HNSWVectorStore
+        return HNSWVectorStore(embed_model=embed_model)
+
+    from deeptxt.vector_stores import ElasticsearchVectorStore
+    store = ElasticsearchVectorStore(index_name=args.es_index, url=args.es_url, user=args.es_user,
+                                     password=args.es_password, dims_length=args.dims,
+                                     embed_model=embed_model, batch_size=args.batch_size)
+    store._client.indices.delete(index=args.es_index, ignore_unavailable=True)
+
+    return store
+
+
+def benchmark_store(store, num_vectors: int, num_queries: int, exact: np.ndarray,
+                    k: int, concurrency: List[int]) -> Dict[str, float]:
+    """Runs the ingest, latency, throughput and recall measurements on one store."""
+    documents = [Document(doc_id=str(i), text=f"doc-{i}") for i in range(num_vectors)]
+    queries = [f"query-{i}" for i in range(num_queries)]
+
+    start = time.perf_counter()
+    store.add_documents(documents)
+    results = {"ingest docs/s": num_vectors / (time.perf_counter() - start)}
+
+    latencies = []
+    approx = []
+    for query in queries:
+        start = time.perf_counter()
+        docs = store.query(query, top_k=k)
+        latencies.append(time.perf_counter() - start)
+        approx.append({int(doc.document.doc_id) for doc in docs})
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    results.update({"p50 ms": p50, "p95 ms": p95, "p99 ms": p99})
+
+    for workers in concurrency:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            start = time.perf_counter()
+            list(executor.map(lambda query: store.query(query, top_k=k), queries))
+            results[f"qps@{workers}"] = num_queries / (time.perf_counter() - start)
+
+    hits = sum(len(a & set(e.tolist())) for a, e in zip(approx, exact))
+    results[f"recall@{k}"] = hits / exact.size
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--stores", nargs="+", choices=["chroma", "hnsw", "elasticsearch"], default=["chroma", "hnsw"])
+    parser.add_argument("--dataset", help="`.npz` file with `vectors` and `queries` arrays.")
+    parser.add_argument("--num-vectors", type=int, default=10000)
+    parser.add_argument("--num-queries", type=int, default=200)
+    parser.add_argument("--dims", type=int, default=128)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--es-url", default="http://localhost:9200")
+    parser.add_argument("--es-user", default="elastic")
+    parser.add_argument("--es-password", default="")
+    parser.add_argument("--es-index", default="deeptxt-benchmark")
+    args = parser.parse_args()
+
+    if args.dataset:
+        vectors, queries = load_dataset(args.dataset)
+        args.dims = vectors.shape[1]
+    else:
+        vectors, queries = make_dataset(args.num_vectors, args.num_queries, args.dims)
+
+    exact = exact_neighbors(vectors, queries, args.k)
+    embed_model = LookupEmbedding(vectors, queries)
+
+    for name in args.stores:
+        store = make_store(name, embed_model, args)
+        results = benchmark_store(store, len(vectors), len(queries), exact, args.k, args.concurrency)
+        print(f"{name}: " + " ".join(f"{metric}={value:.3f}" if "recall" in metric else f"{metric}={value:.1f}"
+                                     for metric, value in results.items()))
+
+
+if __name__ == "__main__":
+    main()
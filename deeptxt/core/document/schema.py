@@ -1,4 +1,6 @@
+import json
 import uuid
+import hashlib
 
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -51,14 +53,37 @@ class Document(BaseDocument):
         """Get metadata."""
         return self.metadata
 
+    @property
+    def hash(self) -> str:
+        """Deterministic SHA-256 fingerprint of the text and metadata."""
+        content = json.dumps({"text": self.text, "metadata": self.metadata}, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     @classmethod
-    def from_langchain_format(cls, doc: "LangChainDocument") -> "Document":
+    def with_content_id(cls, text: str, metadata: Optional[Dict[str, Any]] = None) -> "Document":
+        """
+        Create a document whose `doc_id` is its content fingerprint, so re-ingesting the same content yields the same ID.
+
+        Args:
+            text (str): Text content of the document.
+            metadata (Dict[str, Any], optional): A flat dictionary of metadata fields.
+        """
+        doc = cls(text=text, metadata=metadata)
+        doc.doc_id = doc.hash
+        return doc
+
+    @classmethod
+    def from_langchain_format(cls, doc: "LangChainDocument", content_id: bool = False) -> "Document":
         """
         Convert a document from LangChain  format.
 
         Args:
             doc (LangChainDocument): Document in LangChain format.
+            content_id (bool, optional): Whether to use the content fingerprint as `doc_id`. Defaults to ``False``.
         """
+        if content_id:
+            return cls.with_content_id(text=doc.page_content, metadata=doc.metadata)
+
         return cls(text=doc.page_content, metadata=doc.metadata)
 
 
@@ -1,5 +1,11 @@
 from deeptxt.core.readers.base import BaseReader
+from deeptxt.core.readers.cache import CachedReader, ReaderCache
+from deeptxt.core.readers.manifest import Manifest, ManifestCommitMixin
 
 __all__ = [
     "BaseReader",
+    "CachedReader",
+    "Manifest",
+    "ManifestCommitMixin",
+    "ReaderCache",
 ]
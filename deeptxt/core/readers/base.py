@@ -1,22 +1,40 @@
-from typing import List, Optional
-from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Tuple
+from abc import ABC
 
 from deeptxt.core.document import Document
 
 
 class BaseReader(ABC):
-    """An interface for readers."""
+    """An interface for readers.
+
+    Readers implement `lazy_load` as a generator, so documents can be streamed without holding the whole
+    corpus in memory. `load_data` collects them in a list. Readers implementing only `load_data` are still
+    supported, `lazy_load` then yields from the returned list.
+    """
+
+    # Bump when the extracted documents change, invalidating the entries of `ReaderCache`
+    version: str = "1"
+
+    # Settings which don't change the extracted documents, e.g. parallelism, left out of the `ReaderCache` key
+    cache_ignored_settings: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if cls.lazy_load is BaseReader.lazy_load and cls.load_data is BaseReader.load_data:
+            raise TypeError(f"{cls.__name__} must implement `lazy_load` or `load_data`.")
 
     @classmethod
     def class_name(cls) -> str:
         return "BaseReader"
 
-    @abstractmethod
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields documents one at a time."""
+        yield from self.load_data(extra_info=extra_info)
+
     def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
         """Loads data."""
+        return list(self.lazy_load(extra_info=extra_info))
 
     def load(self) -> List[Document]:
         return self.load_data()
-
-    def lazy_load(self) -> List[Document]:
-        return self.load_data()
@@ -0,0 +1,131 @@
+import os
+import gzip
+import json
+import uuid
+import shutil
+import hashlib
+
+from pathlib import Path
+from typing import Iterator, Optional
+
+from deeptxt.core.document import Document
+from deeptxt.core.readers.base import BaseReader
+from deeptxt.core.readers.utils import file_hash
+
+
+class ReaderCache:
+    """On-disk cache of the documents extracted by file readers, addressed by content.
+
+    Entries are keyed by the SHA-256 of the file content, the reader class and ``version``, and the reader
+    configuration except the file path and its ``cache_ignored_settings``. A file is parsed again only when one of
+    them changes, so moved or renamed files are still read from the cache, with their ``source`` and ``filename``
+    metadata updated. Documents are stored as gzip-compressed JSON Lines.
+
+    Args:
+        cache_dir (str): Directory where the cached documents are stored.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.core.readers import ReaderCache
+        from deeptxt.readers.file import PDFReader
+
+        cache = ReaderCache("./.cache/readers")
+        docs = list(cache.lazy_load(PDFReader(input_file="manual.pdf")))
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        self.cache_dir = cache_dir
+
+    def _key(self, reader: BaseReader) -> str:
+        input_file = getattr(reader, "input_file", None)
+        if input_file is None:
+            raise ValueError(f"{type(reader).__name__} has no `input_file` to cache.")
+
+        reader_cls = type(reader)
+        config = {name: value for name, value in vars(reader).items()
+                  if not name.startswith("_") and name != "input_file" and name not in reader_cls.cache_ignored_settings}
+        key = json.dumps({
+            "file_hash": file_hash(input_file),
+            "reader": f"{reader_cls.__module__}.{reader_cls.__qualname__}",
+            "version": reader_cls.version,
+            "config": config,
+        }, sort_keys=True, default=str)
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.jsonl.gz")
+
+    @staticmethod
+    def _relocate(metadata: dict, cached_file: str, input_file: str) -> None:
+        """Points the metadata derived from the path of the cached file to the file being read."""
+        if metadata.get("source") == cached_file:
+            metadata["source"] = input_file
+        if metadata.get("filename") == Path(cached_file).name:
+            metadata["filename"] = Path(input_file).name
+
+    def lazy_load(self, reader: BaseReader, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the cached documents of the reader file, or parses it and caches its documents.
+
+        Args:
+            reader (BaseReader): File reader, with an ``input_file`` attribute.
+            extra_info (dict, optional): Metadata added to every document, not cached.
+        """
+        path = self._path(self._key(reader))
+        input_file = str(reader.input_file)
+
+        if os.path.isfile(path):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                # The first line records the path the documents were parsed from
+                cached_file = json.loads(f.readline())["input_file"]
+                for line in f:
+                    doc = Document(**json.loads(line))
+                    self._relocate(doc.metadata, cached_file, input_file)
+                    if extra_info:
+                        doc.metadata.update(extra_info)
+
+                    yield doc
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+        # Written while streaming, the entry only becomes visible once the reader is exhausted
+        try:
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                f.write(json.dumps({"input_file": input_file}, ensure_ascii=False) + "\n")
+                for doc in reader.lazy_load():
+                    f.write(json.dumps({"doc_id": doc.doc_id, "text": doc.text, "metadata": doc.metadata},
+                                       ensure_ascii=False, default=str) + "\n")
+                    if extra_info:
+                        doc.metadata.update(extra_info)
+
+                    yield doc
+
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def clear(self) -> None:
+        """Deletes every cached document."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+class CachedReader(BaseReader):
+    """Wraps a file reader, reading its documents through a `ReaderCache`.
+
+    Args:
+        reader (BaseReader): File reader, with an ``input_file`` attribute.
+        cache (ReaderCache): Cache of the extracted documents.
+    """
+
+    def __init__(self, reader: BaseReader, cache: ReaderCache) -> None:
+        self.reader = reader
+        self.cache = cache
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the documents of the wrapped reader, from the cache when the file is unchanged."""
+        yield from self.cache.lazy_load(self.reader, extra_info=extra_info)
@@ -0,0 +1,101 @@
+import os
+import json
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class Manifest:
+    """JSON file recording the state of ingested sources, e.g. file modification times, for incremental ingestion.
+
+    Entries are only written to disk by `save`, atomically, so an interrupted run leaves the previous manifest intact.
+    During a run, readers `mark_seen` every listed key and `stage` the new record of changed ones, which is only
+    applied by `confirm` once the source is read, so failed sources are read again on the next run.
+
+    Args:
+        path (str): Path of the manifest file, created on `save` if it doesn't exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._seen = set()
+        self._staged: Dict[str, Dict[str, Any]] = {}
+
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(key)
+
+    def set(self, key: str, record: Dict[str, Any]) -> None:
+        self.entries[key] = record
+
+    def mark_seen(self, key: str) -> None:
+        """Records a key still present in the source, so `remove_unseen` keeps it."""
+        self._seen.add(key)
+
+    def stage(self, key: str, record: Dict[str, Any]) -> None:
+        """Records the new state of a changed key, applied by `confirm` once it is read."""
+        self._staged[key] = record
+
+    def confirm(self, key: str) -> bool:
+        """Applies the staged record of a key read successfully, returning whether it was modified rather than added."""
+        modified = key in self.entries
+        self.entries[key] = self._staged.pop(key)
+
+        return modified
+
+    def remove_unseen(self, prefix: str = "") -> List[str]:
+        """Removes the entries starting with `prefix` that were not marked as seen, returning them."""
+        return self.remove_missing(self._seen, prefix=prefix)
+
+    def remove_missing(self, keys: Iterable[str], prefix: str = "") -> List[str]:
+        """Removes the entries starting with `prefix` that are not in `keys`, returning them."""
+        keys = set(keys)
+        missing = [key for key in self.entries if key.startswith(prefix) and key not in keys]
+
+        for key in missing:
+            del self.entries[key]
+
+        return missing
+
+    def save(self) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+
+        os.replace(temp_path, self.path)
+
+
+class ManifestCommitMixin:
+    """Adds `commit` to readers ingesting incrementally, which save their `Manifest` once the documents are written.
+
+    `lazy_load` opens the manifest with `_open_manifest` and hands it to `_stage_manifest` once exhausted, so a failed
+    write reads the same sources again on the next run.
+    """
+
+    _manifest: Optional[Manifest] = None
+
+    def _open_manifest(self, path: Optional[str]) -> Optional[Manifest]:
+        """Loads the manifest at the start of `lazy_load`, discarding any uncommitted one."""
+        self._manifest = None
+
+        return Manifest(path) if path is not None else None
+
+    def _stage_manifest(self, manifest: Manifest) -> None:
+        self._manifest = manifest
+
+    def commit(self) -> None:
+        """Saves the manifest updated by the last exhausted `lazy_load`, once its documents are written."""
+        if self._manifest is None:
+            raise ValueError("Nothing to commit, `lazy_load` must be exhausted with a `manifest_path` first.")
+
+        self._manifest.save()
+        self._manifest = None
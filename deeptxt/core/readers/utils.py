@@ -0,0 +1,11 @@
+import hashlib
+
+
+def file_hash(input_file: str) -> str:
+    """SHA-256 of a file content, read in chunks of 1 MiB."""
+    sha256 = hashlib.sha256()
+    with open(input_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+
+    return sha256.hexdigest()
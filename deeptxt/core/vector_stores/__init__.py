@@ -0,0 +1,10 @@
+from deeptxt.core.vector_stores.cache import QueryCache
+from deeptxt.core.vector_stores.filters import MetadataFilter, MetadataFilters
+from deeptxt.core.vector_stores.hnsw import HNSWIndex
+
+__all__ = [
+    "HNSWIndex",
+    "MetadataFilter",
+    "MetadataFilters",
+    "QueryCache",
+]
@@ -0,0 +1,149 @@
+import re
+import json
+import time
+import threading
+import numpy as np
+
+from contextlib import contextmanager
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from deeptxt.core.document import DocumentWithScore
+from deeptxt.core.embeddings import Embedding
+from deeptxt.core.vector_stores.filters import MetadataFilters, to_metadata_filters
+
+
+class QueryCache:
+    """In-memory LRU cache of vector store query results, with expiration and an optional semantic tier.
+
+    Exact hits are keyed by the normalized query text, ``top_k`` and filter. When ``similarity_threshold`` is set,
+    a query missing the exact tier reuses the results of a cached query whose embedding has a cosine similarity
+    above the threshold. Vector stores clear their cache before and after documents are added or deleted.
+
+    Args:
+        max_size (int, optional): Maximum number of cached queries, least recently used are evicted first. Defaults to ``1024``.
+        ttl (float, optional): Seconds before an entry expires. Defaults to ``None`` (never).
+        similarity_threshold (float, optional): Cosine similarity above which a cached query is reused. Defaults to ``None`` (disabled).
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.core.vector_stores import QueryCache
+        from deeptxt.vector_stores import ChromaVectorStore
+
+        db = ChromaVectorStore(embed_model=embedding, cache=QueryCache(ttl=600, similarity_threshold=0.97))
+    """
+
+    def __init__(self, max_size: int = 1024,
+                 ttl: Optional[float] = None,
+                 similarity_threshold: Optional[float] = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _make_key(query: str, top_k: int,
+                  filter: Union[MetadataFilters, Dict[str, Any], None],
+                  params: Dict[str, Any]) -> tuple:
+        normalized_query = re.sub(r"\s+", " ", query).strip().lower()
+        filter = to_metadata_filters(filter)
+        params = {name: value for name, value in params.items() if value is not None}
+
+        return (normalized_query,
+                top_k,
+                filter.json(sort_keys=True) if filter else None,
+                json.dumps(params, sort_keys=True, default=str))
+
+    def _is_expired(self, entry: dict) -> bool:
+        return self.ttl is not None and time.monotonic() - entry["created_at"] > self.ttl
+
+    def get(self, query: str, top_k: int,
+            filter: Union[MetadataFilters, Dict[str, Any]] = None,
+            **params: Any) -> Optional[List[DocumentWithScore]]:
+        """Results cached for the same normalized query, ``top_k``, filter and extra search parameters."""
+        key = self._make_key(query, top_k, filter, params)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if self._is_expired(entry):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return list(entry["results"])
+
+    def get_similar(self, query_embedding: Embedding, top_k: int,
+                    filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                    **params: Any) -> Optional[List[DocumentWithScore]]:
+        """Results of the most similar cached query embedding above ``similarity_threshold``."""
+        if self.similarity_threshold is None:
+            return None
+
+        _, *scope = self._make_key("", top_k, filter, params)
+
+        with self._lock:
+            candidates = [(key, entry) for key, entry in self._entries.items()
+                          if list(key[1:]) == scope and entry["embedding"] is not None
+                          and not self._is_expired(entry)]
+            if not candidates:
+                return None
+
+            query_vector = self._normalize(query_embedding)
+            similarities = np.stack([entry["embedding"] for _, entry in candidates]) @ query_vector
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.similarity_threshold:
+                return None
+
+            key, entry = candidates[best]
+            self._entries.move_to_end(key)
+            return list(entry["results"])
+
+    def put(self, query: str, top_k: int,
+            filter: Union[MetadataFilters, Dict[str, Any]],
+            results: List[DocumentWithScore],
+            query_embedding: Optional[Embedding] = None,
+            **params: Any) -> None:
+        """Cache the results of a query."""
+        key = self._make_key(query, top_k, filter, params)
+        embedding = self._normalize(query_embedding) if query_embedding is not None else None
+
+        with self._lock:
+            self._entries[key] = {"results": list(results), "embedding": embedding, "created_at": time.monotonic()}
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Invalidate every cached query."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _normalize(embedding: Embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+@contextmanager
+def invalidate_cache(cache: Optional[QueryCache]) -> Iterator[None]:
+    """Clears the cache before and after a write, so results cached by queries running during it are dropped."""
+    if cache is not None:
+        cache.clear()
+
+    try:
+        yield
+    finally:
+        if cache is not None:
+            cache.clear()
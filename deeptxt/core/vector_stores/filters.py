@@ -0,0 +1,92 @@
+from typing import Any, Dict, List, Literal, Union
+from pydantic.v1 import BaseModel, Field
+
+
+class MetadataFilter(BaseModel):
+    """Condition on a single metadata key.
+
+    Args:
+        key (str): Metadata key.
+        value (Any): Value to compare with, a list for the ``in`` operator.
+        operator (str, optional): One of ``eq``, ``in``, ``gt``, ``gte``, ``lt``, ``lte``. Defaults to ``eq``.
+    """
+
+    key: str
+    value: Any
+    operator: Literal["eq", "in", "gt", "gte", "lt", "lte"] = "eq"
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """Evaluate the condition against a metadata dictionary."""
+        if self.key not in metadata:
+            return False
+
+        value = metadata[self.key]
+        if self.operator == "eq":
+            return value == self.value
+        elif self.operator == "in":
+            return value in self.value
+
+        try:
+            if self.operator == "gt":
+                return value > self.value
+            elif self.operator == "gte":
+                return value >= self.value
+            elif self.operator == "lt":
+                return value < self.value
+            else:
+                return value <= self.value
+        except TypeError:
+            return False
+
+
+class MetadataFilters(BaseModel):
+    """Backend-neutral metadata filter expression, compiled by each vector store to its native filter.
+
+    Args:
+        filters (List[MetadataFilter | MetadataFilters]): Conditions or nested expressions.
+        condition (str, optional): How to combine ``filters``, ``and`` or ``or``. Defaults to ``and``.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.core.vector_stores import MetadataFilter, MetadataFilters
+
+        filters = MetadataFilters(filters=[
+            MetadataFilter(key="filename", value=["a.pdf", "b.pdf"], operator="in"),
+            MetadataFilter(key="page", value=10, operator="lte"),
+        ])
+        docs = db.query("What's Deep Text", filter=filters)
+    """
+
+    filters: List[Union[MetadataFilter, "MetadataFilters"]] = Field(default_factory=list)
+    condition: Literal["and", "or"] = "and"
+
+    @classmethod
+    def from_dict(cls, filter: Dict[str, Any]) -> "MetadataFilters":
+        """Build an ``and`` expression from key/value pairs, a list value matches any of its items.
+
+        Args:
+            filter (Dict[str, Any]): Metadata key/value pairs, e.g. ``{"filename": "report.pdf"}``.
+        """
+        return cls(filters=[
+            MetadataFilter(key=key, value=value, operator="in" if isinstance(value, list) else "eq")
+            for key, value in filter.items()
+        ])
+
+    def matches(self, metadata: Dict[str, Any]) -> bool:
+        """Evaluate the expression against a metadata dictionary."""
+        results = (f.matches(metadata) for f in self.filters)
+
+        return all(results) if self.condition == "and" else any(results)
+
+
+MetadataFilters.update_forward_refs()
+
+
+def to_metadata_filters(filter: Union[MetadataFilters, Dict[str, Any], None]) -> Union[MetadataFilters, None]:
+    """Accept either a `MetadataFilters` expression or a key/value dictionary shorthand."""
+    if filter is None or isinstance(filter, MetadataFilters):
+        return filter
+
+    return MetadataFilters.from_dict(filter)
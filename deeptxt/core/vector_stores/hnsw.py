@@ -0,0 +1,361 @@
+import heapq
+import json
+import numpy as np
+
+from typing import Callable, List, Literal, Optional, Tuple
+
+
+class HNSWIndex:
+    """Hierarchical Navigable Small World (HNSW) graph for approximate nearest neighbor search.
+
+    Pure NumPy implementation of `Malkov & Yashunin (2016) <https://arxiv.org/abs/1603.09320>`_. Distances
+    between a query and a batch of neighbors are computed with a single matrix product.
+    Deleted elements are tombstoned: they stay in the graph to keep it navigable, but are never returned.
+
+    Args:
+        dims (int): Length of the vectors.
+        space (str, optional): Distance space, one of ``cosine``, ``ip`` or ``l2``. Defaults to ``cosine``.
+        M (int, optional): Maximum number of links per element on upper layers (layer 0 keeps ``2 * M``). Defaults to ``16``.
+        ef_construction (int, optional): Size of the dynamic candidate list during insertion. Defaults to ``200``.
+        ef_search (int, optional): Size of the dynamic candidate list during search. Defaults to ``50``.
+        max_elements (int, optional): Initial capacity, grown automatically. Defaults to ``1024``.
+        seed (int, optional): Random seed used to draw element levels.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.core.vector_stores import HNSWIndex
+
+        index = HNSWIndex(dims=384)
+        labels = index.add_items(vectors)
+        labels, distances = index.knn_query(query_vector, k=4)
+    """
+
+    def __init__(self,
+                 dims: int,
+                 space: Literal["cosine", "ip", "l2"] = "cosine",
+                 M: int = 16,
+                 ef_construction: int = 200,
+                 ef_search: int = 50,
+                 max_elements: int = 1024,
+                 seed: Optional[int] = None,
+                 ) -> None:
+        if space not in ["cosine", "ip", "l2"]:
+            raise ValueError(f"Space {space} not supported.")
+
+        if M < 2:
+            raise ValueError("`M` must be greater than 1.")
+
+        self.dims = dims
+        self.space = space
+        self.M = M
+        self.max_M0 = 2 * M
+        self.ef_construction = max(ef_construction, M)
+        self.ef_search = ef_search
+        self.seed = seed
+
+        self._level_mult = 1 / np.log(M)
+        self._rng = np.random.default_rng(seed)
+        self._data = np.zeros((max(max_elements, 1), dims), dtype=np.float32)
+        self._levels: List[int] = []
+        self._links: List[List[List[int]]] = []
+        self._deleted = set()
+        self._entry_point: Optional[int] = None
+        self._max_level = -1
+
+    def __len__(self) -> int:
+        return len(self._levels) - len(self._deleted)
+
+    @property
+    def element_count(self) -> int:
+        """Number of elements in the graph, including deleted ones."""
+        return len(self._levels)
+
+    def _prepare(self, vectors) -> np.ndarray:
+        """Cast vectors to a float32 matrix, normalized when using the ``cosine`` space."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors[np.newaxis, :]
+
+        if vectors.ndim != 2 or vectors.shape[1] != self.dims:
+            raise ValueError(f"Expected vectors of {self.dims} dimensions, got shape {vectors.shape}.")
+
+        if self.space == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+
+        return vectors
+
+    def _distances(self, query: np.ndarray, nodes: List[int]) -> np.ndarray:
+        """Distances from `query` to a batch of nodes."""
+        vectors = self._data[nodes]
+        if self.space == "l2":
+            diff = vectors - query
+            return np.einsum("ij,ij->i", diff, diff)
+
+        return 1.0 - vectors @ query
+
+    def _search_layer(self, query: np.ndarray,
+                      entry_points: List[int],
+                      ef: int,
+                      level: int,
+                      exclude: Optional[Callable[[int], bool]] = None) -> List[Tuple[float, int]]:
+        """Best-first search on one layer, returns up to `ef` ``(distance, node)`` pairs sorted by distance.
+
+        Nodes for which `exclude` returns ``True`` are traversed but never returned.
+        """
+        visited = set(entry_points)
+        candidates = list(zip(self._distances(query, entry_points).tolist(), entry_points))
+        heapq.heapify(candidates)
+        results = [(-dist, node) for dist, node in candidates
+                   if not (exclude and exclude(node))]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            dist, node = heapq.heappop(candidates)
+            if len(results) >= ef and dist > -results[0][0]:
+                break
+
+            neighbors = [n for n in self._links[node][level] if n not in visited]
+            if not neighbors:
+                continue
+
+            visited.update(neighbors)
+            for neighbor_dist, neighbor in zip(self._distances(query, neighbors).tolist(), neighbors):
+                if len(results) < ef or neighbor_dist < -results[0][0]:
+                    heapq.heappush(candidates, (neighbor_dist, neighbor))
+
+                    if exclude and exclude(neighbor):
+                        continue
+
+                    heapq.heappush(results, (-neighbor_dist, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+
+        return sorted((-dist, node) for dist, node in results)
+
+    def _select_neighbors(self, candidates: List[Tuple[float, int]], m: int) -> List[int]:
+        """Neighbor selection heuristic, keeps candidates closer to the base than to any selected neighbor."""
+        if len(candidates) <= m:
+            return [node for _, node in candidates]
+
+        nodes = [node for _, node in candidates]
+        dists = np.array([dist for dist, _ in candidates], dtype=np.float32)
+        vectors = self._data[nodes]
+        if self.space == "l2":
+            sq_norms = np.einsum("ij,ij->i", vectors, vectors)
+            pairwise = sq_norms[:, np.newaxis] + sq_norms[np.newaxis, :] - 2 * vectors @ vectors.T
+        else:
+            pairwise = 1.0 - vectors @ vectors.T
+
+        selected = []
+        for i in range(len(nodes)):
+            if len(selected) >= m:
+                break
+
+            if selected and (pairwise[i, selected] < dists[i]).any():
+                continue
+
+            selected.append(i)
+
+        return [nodes[i] for i in selected]
+
+    def _random_level(self) -> int:
+        return int(-np.log(1.0 - self._rng.random()) * self._level_mult)
+
+    def _insert(self, vector: np.ndarray) -> int:
+        node = len(self._levels)
+        if node >= self._data.shape[0]:
+            self._data = np.concatenate([self._data, np.zeros_like(self._data)])
+
+        level = self._random_level()
+        self._data[node] = vector
+        self._levels.append(level)
+        self._links.append([[] for _ in range(level + 1)])
+
+        if self._entry_point is None:
+            self._entry_point = node
+            self._max_level = level
+            return node
+
+        entry_points = [self._entry_point]
+        for lc in range(self._max_level, level, -1):
+            entry_points = [self._search_layer(vector, entry_points, 1, lc)[0][1]]
+
+        for lc in range(min(level, self._max_level), -1, -1):
+            candidates = self._search_layer(vector, entry_points, self.ef_construction, lc)
+            max_links = self.max_M0 if lc == 0 else self.M
+            neighbors = self._select_neighbors(candidates, self.M)
+            self._links[node][lc] = neighbors
+
+            for neighbor in neighbors:
+                links = self._links[neighbor][lc]
+                links.append(node)
+
+                if len(links) > max_links:
+                    dists = self._distances(self._data[neighbor], links)
+                    order = np.argsort(dists)
+                    self._links[neighbor][lc] = self._select_neighbors(
+                        [(float(dists[i]), links[i]) for i in order], max_links)
+
+            entry_points = [n for _, n in candidates]
+
+        if level > self._max_level:
+            self._entry_point = node
+            self._max_level = level
+
+        return node
+
+    def add_items(self, vectors) -> List[int]:
+        """Insert vectors into the index.
+
+        Args:
+            vectors (array-like): Vector or matrix of shape ``(n, dims)``.
+
+        Returns:
+            List[int]: Labels assigned to the inserted vectors.
+        """
+        return [self._insert(vector) for vector in self._prepare(vectors)]
+
+    def mark_deleted(self, label: int) -> None:
+        """Tombstone an element, excluding it from query results.
+
+        Args:
+            label (int): Label of the element to delete.
+        """
+        if label < 0 or label >= len(self._levels):
+            raise ValueError(f"Label {label} not found.")
+
+        self._deleted.add(label)
+
+    def get_items(self, labels: List[int]) -> np.ndarray:
+        """Stored vectors of the given labels, normalized when using the ``cosine`` space.
+
+        Args:
+            labels (List[int]): Element labels.
+        """
+        return self._data[np.asarray(labels, dtype=np.int64)].copy()
+
+    def knn_query(self, vector, k: int = 1,
+                  ef: Optional[int] = None,
+                  filter: Optional[Callable[[int], bool]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Approximate k-nearest neighbors search.
+
+        Args:
+            vector (array-like): Query vector.
+            k (int, optional): Number of neighbors to return. Defaults to ``1``.
+            ef (int, optional): Size of the dynamic candidate list. Defaults to ``ef_search``.
+            filter (Callable[[int], bool], optional): Predicate on labels, only matching elements are returned.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Labels and distances, sorted by distance.
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        query = self._prepare(vector)[0]
+        ef = max(ef or self.ef_search, k)
+
+        entry_points = [self._entry_point]
+        for lc in range(self._max_level, 0, -1):
+            entry_points = [self._search_layer(query, entry_points, 1, lc)[0][1]]
+
+        def exclude(node: int) -> bool:
+            return node in self._deleted or (filter is not None and not filter(node))
+
+        results = self._search_layer(query, entry_points, ef, 0, exclude=exclude)[:k]
+
+        return (np.array([node for _, node in results], dtype=np.int64),
+                np.array([dist for dist, _ in results], dtype=np.float32))
+
+    def exact_query(self, vector, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact k-nearest neighbors search by brute force, useful as ground truth.
+
+        Args:
+            vector (array-like): Query vector.
+            k (int, optional): Number of neighbors to return. Defaults to ``1``.
+        """
+        query = self._prepare(vector)[0]
+        nodes = np.arange(len(self._levels))
+        if self._deleted:
+            nodes = np.setdiff1d(nodes, np.fromiter(self._deleted, dtype=np.int64))
+
+        if nodes.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        dists = self._distances(query, nodes)
+        k = min(k, nodes.size)
+        top = np.argpartition(dists, k - 1)[:k]
+        top = top[np.argsort(dists[top])]
+
+        return nodes[top].astype(np.int64), dists[top].astype(np.float32)
+
+    def save(self, path: str) -> None:
+        """Save the index to a NumPy ``.npz`` file.
+
+        Args:
+            path (str): File path.
+        """
+        config = {
+            "dims": self.dims,
+            "space": self.space,
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+            "seed": self.seed,
+            "entry_point": self._entry_point,
+            "max_level": self._max_level,
+        }
+        node_links = [links for node in self._links for links in node]
+
+        np.savez(path,
+                 config=np.array(json.dumps(config)),
+                 data=self._data[:len(self._levels)],
+                 levels=np.array(self._levels, dtype=np.int64),
+                 deleted=np.array(sorted(self._deleted), dtype=np.int64),
+                 link_counts=np.array([len(links) for links in node_links], dtype=np.int64),
+                 link_data=np.array([n for links in node_links for n in links], dtype=np.int64))
+
+    @classmethod
+    def load(cls, path: str) -> "HNSWIndex":
+        """Load an index saved with :meth:`save`.
+
+        Args:
+            path (str): File path.
+        """
+        with np.load(path, allow_pickle=False) as f:
+            config = json.loads(f["config"].item())
+            data = f["data"]
+            levels = f["levels"].tolist()
+            deleted = f["deleted"].tolist()
+            link_counts = f["link_counts"].tolist()
+            link_data = f["link_data"].tolist()
+
+        index = cls(dims=config["dims"],
+                    space=config["space"],
+                    M=config["M"],
+                    ef_construction=config["ef_construction"],
+                    ef_search=config["ef_search"],
+                    max_elements=len(levels),
+                    seed=config["seed"])
+
+        index._data[:len(levels)] = data
+        index._levels = levels
+        index._deleted = set(deleted)
+        index._entry_point = config["entry_point"]
+        index._max_level = config["max_level"]
+
+        offset = 0
+        counts = iter(link_counts)
+        for level in levels:
+            node_links = []
+            for _ in range(level + 1):
+                count = next(counts)
+                node_links.append(link_data[offset:offset + count])
+                offset += count
+            index._links.append(node_links)
+
+        return index
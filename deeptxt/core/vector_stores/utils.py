@@ -0,0 +1,91 @@
+import numpy as np
+
+from typing import Any, Dict, List, Tuple
+
+from deeptxt.core.document import Document
+from deeptxt.core.embeddings import Embedding
+
+
+def diff_documents(documents: List[Document],
+                   stored_hashes: Dict[str, str]) -> Tuple[List[Document], Dict[str, List[str]]]:
+    """Compare documents with the fingerprints of their stored version.
+
+    Args:
+        documents (List[Document]): Incoming documents.
+        stored_hashes (Dict[str, str]): `Document.hash` of the stored documents, by ID.
+
+    Returns:
+        Tuple[List[Document], Dict[str, List[str]]]: Documents to write, and the IDs ``added``, ``updated`` and ``unchanged``.
+    """
+    changed = []
+    result = {"added": [], "updated": [], "unchanged": []}
+
+    for doc in documents:
+        if doc.doc_id not in stored_hashes:
+            result["added"].append(doc.doc_id)
+        elif stored_hashes[doc.doc_id] != doc.hash:
+            result["updated"].append(doc.doc_id)
+        else:
+            result["unchanged"].append(doc.doc_id)
+            continue
+
+        changed.append(doc)
+
+    return changed, result
+
+
+def get_sources(documents: List[Document], source_key: str) -> List[Any]:
+    """Distinct values of a metadata key across documents."""
+    return list({doc.get_metadata()[source_key] for doc in documents
+                 if doc.get_metadata().get(source_key) is not None})
+
+
+def maximal_marginal_relevance(query_embedding: Embedding,
+                               embeddings: List[Embedding],
+                               top_k: int = 4,
+                               lambda_mult: float = 0.5) -> List[int]:
+    """Select embeddings that are relevant to the query and diverse among themselves.
+
+    Each step picks the candidate maximizing ``lambda_mult * sim(query) - (1 - lambda_mult) * max sim(selected)``,
+    with cosine similarities. The similarity to the selected set is updated incrementally, one matrix-vector
+    product per step.
+
+    Args:
+        query_embedding (Embedding): Query embedding.
+        embeddings (List[Embedding]): Candidate embeddings.
+        top_k (int, optional): Number of candidates to select. Defaults to ``4``.
+        lambda_mult (float, optional): Trade-off between relevance (``1``) and diversity (``0``). Defaults to ``0.5``.
+
+    Returns:
+        List[int]: Indices of the selected candidates, in selection order.
+    """
+    if not 0 <= lambda_mult <= 1:
+        raise ValueError("`lambda_mult` must be between 0 and 1.")
+
+    if top_k <= 0 or len(embeddings) == 0:
+        return []
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors = vectors / np.where(norms == 0, 1, norms)
+
+    query = np.asarray(query_embedding, dtype=np.float32)
+    query = query / (np.linalg.norm(query) or 1)
+
+    query_similarity = vectors @ query
+    selected_similarity = np.full(len(vectors), -np.inf, dtype=np.float32)
+    available = np.ones(len(vectors), dtype=bool)
+
+    selected = [int(np.argmax(query_similarity))]
+    available[selected[0]] = False
+
+    while len(selected) < min(top_k, len(vectors)):
+        selected_similarity = np.maximum(selected_similarity, vectors @ vectors[selected[-1]])
+        scores = lambda_mult * query_similarity - (1 - lambda_mult) * selected_similarity
+        scores[~available] = -np.inf
+
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+
+    return selected
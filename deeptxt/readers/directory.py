@@ -1,13 +1,15 @@
 import os
+import logging
 
 from pathlib import Path
-from typing import List, Optional, Type, Callable
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Generator, Iterator, List, Optional, Tuple, Type, Callable
 
-from deeptxt.core.readers import BaseReader
+from deeptxt.core.readers import BaseReader, Manifest, ManifestCommitMixin, ReaderCache
+from deeptxt.core.readers.utils import file_hash
 from deeptxt.core.document import Document
 
-from langchain_community.document_loaders import DirectoryLoader
-
 
 def _loading_default_file_readers():
     from deeptxt.readers.file import DocxReader
@@ -23,19 +25,67 @@ def _loading_default_file_readers():
     return default_file_reader_cls
 
 
-class DirectoryReader(BaseReader):
+def _read_file(reader_cls: Type[BaseReader], input_file: str,
+               cache_dir: Optional[str] = None) -> Tuple[str, List[Document], Optional[str]]:
+    """Parses one file, returning the error instead of raising so a corrupt file doesn't abort the run."""
+    try:
+        reader = reader_cls(input_file=input_file)
+        if cache_dir is not None:
+            return input_file, list(ReaderCache(cache_dir).lazy_load(reader)), None
+
+        return input_file, reader.load_data(), None
+    except Exception as e:
+        return input_file, [], f"{type(e).__name__}: {e}"
+
+
+class DirectoryReader(ManifestCommitMixin, BaseReader):
     """Simple directory reader.
 
+    The directory is walked once with ``os.scandir`` and each file is parsed by the reader registered for its
+    suffix. With ``num_workers > 1`` files are parsed in a process pool, and documents are yielded by `lazy_load`
+    as soon as their file is parsed. Files failing to parse are logged and skipped.
+
+    With a ``manifest_path``, only files added or modified since the previous run are parsed, based on their
+    modification time and size, and optionally their content hash. Once `lazy_load` is exhausted, paths of modified
+    and deleted files are listed in ``modified_files`` and ``deleted_files``. The manifest is only saved by `commit`,
+    to be called after the documents are written, so a failed write parses the same files again on the next run.
+
     Args:
         input_dir (str): Directory path from which to load the documents.
+        file_reader (dict[str, Type[BaseReader]], optional): Readers by file suffix, e.g. ``{".pdf": PDFReader}``, extending the default readers.
         recursive (str, optional): Whether to recursively search for files. Defaults to ``False``.
+        num_workers (int, optional): Number of worker processes parsing files. Defaults to ``1`` (no pool).
+        manifest_path (str, optional): Path of the JSON manifest used for incremental ingestion.
+        hash_files (bool, optional): Whether to compare the content hash of files whose modification time changed. Defaults to ``False``.
+        cache_dir (str, optional): Directory of a `ReaderCache`, so unchanged files are not parsed again.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.readers import DirectoryReader
+
+        reader = DirectoryReader(input_dir="./data", recursive=True, num_workers=8)
+        for doc in reader.lazy_load():
+            ...
+
+        # Incremental ingestion
+        reader = DirectoryReader(input_dir="./data", recursive=True, manifest_path="./index/manifest.json")
+        db.upsert_documents(reader.load_data(), source_key="source")  # Replaces the chunks of modified files
+        if reader.deleted_files:
+            db.delete_by_metadata({"source": reader.deleted_files})
+        reader.commit()
     """
 
-    input_dir: Callable = _loading_default_file_readers
+    default_file_reader_fn: Callable = staticmethod(_loading_default_file_readers)
 
     def __init__(self, input_dir: str = None,
                  file_reader: Optional[dict[str, Type[BaseReader]]] = None,
-                 recursive: Optional[bool] = False):
+                 recursive: Optional[bool] = False,
+                 num_workers: int = 1,
+                 manifest_path: str = None,
+                 hash_files: bool = False,
+                 cache_dir: str = None):
 
         if not input_dir:
             raise ValueError("You must provide a `input_dir` parameter")
@@ -43,6 +93,9 @@ class DirectoryReader(BaseReader):
         if not os.path.isdir(input_dir):
             raise ValueError(f"Directory `{input_dir}` does not exist")
 
+        if num_workers < 1:
+            raise ValueError("`num_workers` must be greater than 0.")
+
         if file_reader is not None:
             self.file_reader = file_reader
         else:
@@ -50,21 +103,144 @@ class DirectoryReader(BaseReader):
 
         self.input_dir = Path(input_dir)
         self.recursive = recursive
-
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified directory."""
-        documents = []
-        default_file_reader_cls = DirectoryReader.default_file_reader_fn()
-
-        file_reader = self.file_reader | default_file_reader_cls
-        file_reader_suffix = list(file_reader.keys())
-
-        for file_suffix in file_reader_suffix:
-            print(file_suffix)
-            #TO-DO add `file_reader_kwargs`
-            docs = DirectoryLoader(self.input_dir, glob=f"**/*{file_suffix}",
-                                   loader_cls=file_reader[file_suffix]).load()
-
-            documents.extend(docs)
-            # TO-DO extend `doc.metadata` with `extra_info`
-        return documents
+        self.num_workers = num_workers
+        self.manifest_path = manifest_path
+        self.hash_files = hash_files
+        self.cache_dir = cache_dir
+        self.errors: List[Tuple[str, str]] = []
+        self.modified_files: List[str] = []
+        self.deleted_files: List[str] = []
+
+    def _iter_files(self, file_reader: dict[str, Type[BaseReader]]) -> Iterator[Tuple[str, Type[BaseReader]]]:
+        """Single ``os.scandir`` walk yielding files with a registered suffix, and their reader."""
+        suffixes = {suffix.lower(): reader_cls for suffix, reader_cls in file_reader.items()}
+        stack = [str(self.input_dir)]
+
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if self.recursive:
+                                stack.append(entry.path)
+
+                        elif entry.is_file():
+                            reader_cls = suffixes.get(os.path.splitext(entry.name)[1].lower())
+                            if reader_cls is not None:
+                                yield entry.path, reader_cls
+            except OSError as e:
+                logging.error(f"Error scanning directory: {e}")
+
+    def _iter_changed_files(self, files: Iterator[Tuple[str, Type[BaseReader]]],
+                            manifest: Manifest) -> Iterator[Tuple[str, Type[BaseReader]]]:
+        """Filters out files unchanged since the manifest was saved, staging the records of changed ones."""
+        for input_file, reader_cls in files:
+            manifest.mark_seen(input_file)
+
+            try:
+                stat = os.stat(input_file)
+            except OSError as e:
+                logging.error(f"Error reading `{input_file}`: {e}")
+                continue
+
+            record = {"mtime": stat.st_mtime, "size": stat.st_size}
+            previous = manifest.get(input_file)
+            if previous is not None and previous["mtime"] == record["mtime"] and previous["size"] == record["size"]:
+                continue
+
+            if self.hash_files:
+                record["hash"] = file_hash(input_file)
+                if previous is not None and previous.get("hash") == record["hash"]:
+                    manifest.set(input_file, record)
+                    continue
+
+            manifest.stage(input_file, record)
+            yield input_file, reader_cls
+
+    @staticmethod
+    def _drain(pending: dict, return_when: str) -> Generator[Tuple[str, List[Document], Optional[str]], None, bool]:
+        """Yields the results of completed futures, returning whether the process pool broke."""
+        done, _ = wait(pending, return_when=return_when)
+
+        broken = False
+        for future in done:
+            input_file = pending.pop(future)
+            try:
+                yield future.result()
+            except BrokenProcessPool as e:
+                broken = True
+                yield input_file, [], f"{type(e).__name__}: {e}"
+
+        return broken
+
+    def _iter_parsed(self, files: Iterator[Tuple[str, Type[BaseReader]]]) -> Iterator[Tuple[str, List[Document], Optional[str]]]:
+        """Parses files in order, or in a process pool as they complete, keeping a bounded number in flight.
+
+        When a worker process dies, e.g. a parser crashing or running out of memory, the files in flight fail
+        and the pool is restarted for the remaining files.
+        """
+        if self.num_workers == 1:
+            for input_file, reader_cls in files:
+                yield _read_file(reader_cls, input_file, self.cache_dir)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=self.num_workers)
+        pending = {}
+        try:
+            for input_file, reader_cls in files:
+                try:
+                    future = executor.submit(_read_file, reader_cls, input_file, self.cache_dir)
+                except BrokenProcessPool:
+                    # Broke since the last results were collected
+                    yield from self._drain(pending, ALL_COMPLETED)
+                    executor.shutdown()
+                    executor = ProcessPoolExecutor(max_workers=self.num_workers)
+                    future = executor.submit(_read_file, reader_cls, input_file, self.cache_dir)
+
+                pending[future] = input_file
+
+                if len(pending) >= 2 * self.num_workers and (yield from self._drain(pending, FIRST_COMPLETED)):
+                    yield from self._drain(pending, ALL_COMPLETED)
+                    executor.shutdown()
+                    executor = ProcessPoolExecutor(max_workers=self.num_workers)
+
+            yield from self._drain(pending, ALL_COMPLETED)
+        finally:
+            executor.shutdown()
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the documents of each file as soon as it is parsed.
+
+        Args:
+            extra_info (dict, optional): Metadata added to every document.
+        """
+        file_reader = DirectoryReader.default_file_reader_fn() | self.file_reader
+        self.errors = []
+        self.modified_files = []
+        self.deleted_files = []
+
+        files = self._iter_files(file_reader)
+
+        manifest = self._open_manifest(self.manifest_path)
+        if manifest is not None:
+            files = self._iter_changed_files(files, manifest)
+
+        for input_file, documents, error in self._iter_parsed(files):
+            if error is not None:
+                # Failed files keep their previous record, so they are parsed again on the next run
+                logging.error(f"Error reading `{input_file}`: {error}")
+                self.errors.append((input_file, error))
+                continue
+
+            if manifest is not None and manifest.confirm(input_file):
+                self.modified_files.append(input_file)
+
+            for doc in documents:
+                if extra_info:
+                    doc.metadata.update(extra_info)
+
+                yield doc
+
+        if manifest is not None:
+            self.deleted_files = manifest.remove_unseen(prefix=os.path.join(str(self.input_dir), ""))
+            self._stage_manifest(manifest)
@@ -1,7 +1,7 @@
 import os
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, Optional
 
 from deeptxt.core.readers import BaseReader
 from deeptxt.core.document import Document
@@ -31,8 +31,7 @@ class DocxReader(BaseReader):
 
         self.input_file = Path(input_file)
 
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified directory."""
-        lc_documents = Docx2txtLoader(file_path=self.input_file).load()
-
-        return [Document().from_langchain_format(doc=doc) for doc in lc_documents]
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the documents of the file."""
+        for doc in Docx2txtLoader(file_path=self.input_file).lazy_load():
+            yield Document.from_langchain_format(doc=doc)
@@ -1,22 +1,159 @@
 import os
+import re
+import codecs
 
 from pathlib import Path
-from typing import List, Optional
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional
 
 from deeptxt.core.readers import BaseReader
 from deeptxt.core.document import Document
 
-from langchain_community.document_loaders import UnstructuredHTMLLoader
+
+_SKIPPED_TAGS = {"script", "style", "nav", "noscript", "template", "svg", "iframe", "object"}
+
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "caption", "dd", "details", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "ol", "p", "pre", "section", "summary", "table", "tbody", "tfoot", "thead", "tr", "ul",
+}
+
+_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+_WHITESPACE = re.compile(r"\s+")
+
+_BOMS = [(codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16")]
+
+# Matches both ``<meta charset="...">`` and ``<meta http-equiv="Content-Type" content="text/html; charset=...">``
+_META_CHARSET = re.compile(rb"<meta[^>]*?charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+
+
+def _detect_encoding(data: bytes) -> str:
+    """Encoding of an HTML page from its byte order mark, or the ``<meta>`` charset in its first bytes."""
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return encoding
+
+    match = _META_CHARSET.search(data[:4096])
+    if match:
+        try:
+            encoding = codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            return "utf-8"
+
+        # As in browsers, a page readable as ASCII isn't UTF-16, and latin-1 labels mean windows-1252
+        if encoding.startswith(("utf-16", "utf-32")):
+            return "utf-8"
+        if encoding in ("iso8859-1", "ascii"):
+            return "cp1252"
+
+        return encoding
+
+    return "utf-8"
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collects visible text as paragraphs, one per block element, along with the title and headings."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.paragraphs: List[str] = []
+        self.headings: List[str] = []
+        self.title = ""
+
+        self._parts: List[str] = []
+        self._heading_parts: List[str] = []
+        self._skip_depth = 0
+        self._pre_depth = 0
+        self._in_title = False
+        self._in_heading = False
+
+    def _flush(self) -> None:
+        text = "".join(self._parts)
+        if self._pre_depth:
+            # Preformatted text keeps its indentation, only the surrounding blank lines are dropped
+            paragraph = text.strip("\n").rstrip()
+        else:
+            lines = (line.strip() for line in text.split("\n"))
+            paragraph = "\n".join(line for line in lines if line)
+
+        if paragraph:
+            self.paragraphs.append(paragraph)
+
+        self._parts = []
+
+    def handle_starttag(self, tag, attrs) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "br":
+            self._parts.append("\n")
+        elif tag in ("td", "th"):
+            self._parts.append(" ")
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+            if tag == "pre":
+                self._pre_depth += 1
+            elif tag in _HEADING_TAGS:
+                self._in_heading = True
+                self._heading_parts = []
+
+    def handle_startendtag(self, tag, attrs) -> None:
+        if tag == "br":
+            self._parts.append("\n")
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag == "title":
+            self._in_title = False
+        elif tag in _BLOCK_TAGS:
+            self._flush()
+
+            if tag == "pre":
+                self._pre_depth = max(self._pre_depth - 1, 0)
+            elif tag in _HEADING_TAGS and self._in_heading:
+                self._in_heading = False
+                heading = _WHITESPACE.sub(" ", "".join(self._heading_parts)).strip()
+                if heading:
+                    self.headings.append(heading)
+
+    def handle_data(self, data) -> None:
+        if self._skip_depth:
+            return
+
+        if self._in_title:
+            self.title += data
+            return
+
+        if self._in_heading:
+            self._heading_parts.append(data)
+
+        self._parts.append(data if self._pre_depth else _WHITESPACE.sub(" ", data))
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        self.title = _WHITESPACE.sub(" ", self.title).strip()
 
 
 class HTMLReader(BaseReader):
     """HTML reader.
 
+    Text is extracted with the standard library ``html.parser``. Scripts, styles and navigation are dropped, and
+    each block element (paragraph, heading, list item, table row...) becomes a paragraph, separated by a blank line.
+    The encoding is taken from the byte order mark or the ``<meta>`` charset, and defaults to UTF-8.
+
     Args:
         input_file (str): File path to read.
+        extract_metadata (bool, optional): Whether to add the page ``title`` and ``headings`` to metadata. Defaults to ``False``.
     """
 
-    def __init__(self, input_file: str = None):
+    def __init__(self, input_file: str = None, extract_metadata: bool = False):
 
         if not input_file:
             raise ValueError("You must provide a `input_dir` parameter")
@@ -25,9 +162,22 @@ class HTMLReader(BaseReader):
             raise ValueError(f"File `{input_file}` does not exist")
 
         self.input_file = Path(input_file)
+        self.extract_metadata = extract_metadata
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the document of the file."""
+        with open(self.input_file, "rb") as f:
+            data = f.read()
+
+        html = data.decode(_detect_encoding(data), errors="replace")
+
+        parser = _HTMLTextExtractor()
+        parser.feed(html)
+        parser.close()
 
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified directory."""
-        lc_documents = UnstructuredHTMLLoader(file_path=self.input_file).load()
+        metadata = {"source": str(self.input_file), "filename": self.input_file.name, "file_type": "html"}
+        if self.extract_metadata:
+            metadata["title"] = parser.title
+            metadata["headings"] = "\n".join(parser.headings)
 
-        return [Document().from_langchain_format(doc=doc) for doc in lc_documents]
+        yield Document(text="\n\n".join(parser.paragraphs), metadata=metadata | (extra_info or {}))
@@ -1,7 +1,9 @@
 import os
+import json
+import logging
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, TextIO
 
 from deeptxt.core.readers import BaseReader
 from deeptxt.core.document import Document
@@ -9,22 +11,98 @@ from deeptxt.core.document import Document
 from langchain_community.document_loaders import JSONLoader
 
 
+def _iter_json_array(f: TextIO, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Incrementally decodes the items of a top-level JSON array, holding about one item in memory.
+
+    A file whose top-level value isn't an array is decoded as a single item.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith("["):
+        yield json.loads(buffer + f.read())
+        return
+
+    buffer = buffer[1:]
+    eof = False
+    while True:
+        buffer = buffer.lstrip()
+        if buffer.startswith(","):
+            buffer = buffer[1:].lstrip()
+
+        if buffer.startswith("]"):
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer)
+
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(buffer) and not eof:
+                raise json.JSONDecodeError("Truncated item", buffer, end)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+
+            # Grow reads geometrically so large items are not re-scanned once per chunk
+            chunk = f.read(max(chunk_size, len(buffer)))
+            eof = not chunk
+            buffer += chunk
+            continue
+
+        yield item
+        buffer = buffer[end:]
+
+
+def _get_path(record: Any, path: str) -> Any:
+    """Value at a dotted path, e.g. ``data.title``, or ``None`` if missing."""
+    value = record
+    for key in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(key)
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return None
+
+    return value
+
+
 class JSONReader(BaseReader):
     """JSON reader.
 
+    Without ``jq_schema``, the file is streamed: JSON Lines files (``.jsonl``, ``.ndjson``) are read line by line and
+    top-level JSON arrays are decoded one item at a time, so memory doesn't grow with the file size. Each record
+    becomes a `Document` whose text is taken from ``content_key`` and metadata from ``metadata_keys``.
+
     Args:
         input_file (str): File path to read.
-        jq_schema (str, optional): jq schema to use to extract the data from the JSON.
+        jq_schema (str, optional): jq schema to use to extract the data from the JSON, loads the whole file with ``jq``.
         text_content (bool, optional): Flag to indicate whether the content is in string format. Default is ``False``
+        content_key (str, optional): Dotted path of the record content, e.g. ``data.body``. Defaults to the whole record.
+        metadata_keys (List[str], optional): Dotted paths of the record values added to metadata.
+        json_lines (bool, optional): Whether the file is JSON Lines. Defaults to detecting it from the file suffix.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.readers.file import JSONReader
+
+        reader = JSONReader(input_file="export.jsonl", content_key="body", metadata_keys=["id", "author.name"])
+        for batch in reader.iter_batches(batch_size=500):
+            db.add_documents(batch)
     """
 
     def __init__(self, input_file: str = None,
                  jq_schema: Optional[str] = None,
-                 text_content: Optional[bool] = False):
-        try:
-            import jq  # noqa: F401
-        except ImportError:
-            raise ImportError("jq package not found, please install it with `pip install jq`")
+                 text_content: Optional[bool] = False,
+                 content_key: Optional[str] = None,
+                 metadata_keys: Optional[List[str]] = None,
+                 json_lines: Optional[bool] = None):
+        if jq_schema is not None:
+            try:
+                import jq  # noqa: F401
+            except ImportError:
+                raise ImportError("jq package not found, please install it with `pip install jq`")
 
         if not input_file:
             raise ValueError("You must provide a `input_dir` parameter")
@@ -35,11 +113,71 @@ class JSONReader(BaseReader):
         self.input_file = Path(input_file)
         self.jq_schema = jq_schema
         self.text_content = text_content
+        self.content_key = content_key
+        self.metadata_keys = metadata_keys or []
+
+        if json_lines is None:
+            json_lines = self.input_file.suffix.lower() in [".jsonl", ".ndjson"]
+
+        self.json_lines = json_lines
+
+    def _iter_records(self) -> Iterator[Any]:
+        with open(self.input_file, encoding="utf-8") as f:
+            if not self.json_lines:
+                yield from _iter_json_array(f)
+                return
+
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logging.error(f"Error reading `{self.input_file}` line {line_number}: {e}")
+
+    def _to_document(self, record: Any, seq_num: int, extra_info: Optional[dict] = None) -> Document:
+        content = _get_path(record, self.content_key) if self.content_key else record
+
+        if self.text_content and not isinstance(content, str):
+            raise ValueError(f"Expected a string content, got {type(content).__name__} in record {seq_num}")
+
+        text = content if isinstance(content, str) else json.dumps(content, ensure_ascii=False)
+
+        metadata = {"source": str(self.input_file), "seq_num": seq_num}
+        for key in self.metadata_keys:
+            metadata[key] = _get_path(record, key)
+
+        return Document(text=text, metadata=metadata | (extra_info or {}))
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the records of the file."""
+        if self.jq_schema is not None:
+            loader = JSONLoader(file_path=self.input_file,
+                                jq_schema=self.jq_schema,
+                                text_content=self.text_content)
+
+            for doc in loader.lazy_load():
+                yield Document.from_langchain_format(doc=doc)
+            return
+
+        for seq_num, record in enumerate(self._iter_records(), start=1):
+            yield self._to_document(record, seq_num, extra_info)
+
+    def iter_batches(self, batch_size: int = 1000, extra_info: Optional[dict] = None) -> Iterator[List[Document]]:
+        """Yields the records of the file in lists of at most ``batch_size`` documents.
+
+        Args:
+            batch_size (int, optional): Maximum number of documents per batch. Defaults to ``1000``.
+            extra_info (dict, optional): Metadata added to every document.
+        """
+        batch = []
+        for doc in self.lazy_load(extra_info=extra_info):
+            batch.append(doc)
 
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified directory."""
-        lc_documents = JSONLoader(file_path=self.input_file,
-                                  jq_schema=self.jq_schema,
-                                  text_content=self.text_content).load()
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
 
-        return [Document().from_langchain_format(doc=doc) for doc in lc_documents]
+        if batch:
+            yield batch
@@ -1,22 +1,71 @@
 import os
 
 from pathlib import Path
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 
 from deeptxt.core.readers import BaseReader
 from deeptxt.core.document import Document
 
-from langchain_community.document_loaders.pdf import PyPDFLoader
+
+def _has_text_layer(resources, depth: int = 0) -> bool:
+    """Whether page resources declare fonts, directly or in form XObjects. Scanned pages don't."""
+    resources = resources.get_object() if resources is not None else None
+    if not resources:
+        return False
+
+    if "/Font" in resources:
+        return True
+
+    xobjects = resources.get("/XObject")
+    if xobjects is None or depth >= 5:
+        return False
+
+    for xobject in xobjects.get_object().values():
+        xobject = xobject.get_object()
+        if xobject.get("/Subtype") == "/Form" and _has_text_layer(xobject.get("/Resources"), depth + 1):
+            return True
+
+    return False
+
+
+def _extract_page_text(page) -> str:
+    if not _has_text_layer(page.get("/Resources")):
+        return ""
+
+    return page.extract_text()
+
+
+def _extract_page_range(input_file: str, start: int, stop: int) -> List[Tuple[int, str]]:
+    """Extracts the text of pages ``[start, stop)``, run in a worker process."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(input_file)
+
+    return [(i, _extract_page_text(reader.pages[i])) for i in range(start, stop)]
 
 
 class PDFReader(BaseReader):
     """PDF reader using PyPDF.
 
+    Pages are yielded one at a time as `Document` objects. Pages without a text layer, e.g. scanned pages, are
+    detected from their resources and skipped without running text extraction. With ``num_workers > 1``, ranges
+    of ``pages_per_worker`` pages are extracted in parallel worker processes, and still yielded in page order.
+
+    Metadata follows the fields indexed by `ElasticsearchVectorStore`: ``filename``, ``file_type``, ``page``
+    (starting at ``1``) and ``creation_date`` when the PDF has one.
+
     Args:
         input_file (str): File path to read.
+        num_workers (int, optional): Number of worker processes extracting pages. Defaults to ``1`` (no pool).
+        pages_per_worker (int, optional): Number of pages extracted by each worker task. Defaults to ``50``.
     """
 
-    def __init__(self, input_file: str = None):
+    cache_ignored_settings = ("num_workers", "pages_per_worker")
+
+    def __init__(self, input_file: str = None,
+                 num_workers: int = 1,
+                 pages_per_worker: int = 50):
 
         try:
             import pypdf  # noqa: F401
@@ -29,10 +78,58 @@ class PDFReader(BaseReader):
         if not os.path.isfile(input_file):
             raise ValueError(f"File `{input_file}` does not exist")
 
+        if num_workers < 1:
+            raise ValueError("`num_workers` must be greater than 0.")
+
         self.input_file = Path(input_file)
+        self.num_workers = num_workers
+        self.pages_per_worker = pages_per_worker
+
+    def _get_metadata(self, reader) -> dict:
+        metadata = {
+            "source": str(self.input_file),
+            "filename": self.input_file.name,
+            "file_type": "pdf",
+            "total_pages": len(reader.pages),
+        }
+
+        try:
+            creation_date = reader.metadata.creation_date if reader.metadata else None
+        except Exception:
+            creation_date = None
+
+        if creation_date is not None:
+            metadata["creation_date"] = creation_date.strftime("%Y-%m-%d")
+
+        return metadata
+
+    def _iter_pages(self, reader) -> Iterator[Tuple[int, str]]:
+        num_pages = len(reader.pages)
+
+        if self.num_workers == 1 or num_pages <= self.pages_per_worker:
+            for i, page in enumerate(reader.pages):
+                yield i, _extract_page_text(page)
+            return
+
+        ranges = [(start, min(start + self.pages_per_worker, num_pages))
+                  for start in range(0, num_pages, self.pages_per_worker)]
+
+        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+            futures = [executor.submit(_extract_page_range, str(self.input_file), start, stop)
+                       for start, stop in ranges]
+
+            for future in futures:
+                yield from future.result()
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the pages of the file with text."""
+        from pypdf import PdfReader
+
+        reader = PdfReader(self.input_file)
+        metadata = self._get_metadata(reader) | (extra_info or {})
 
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified directory."""
-        lc_documents = PyPDFLoader(file_path=self.input_file).load()
+        for i, text in self._iter_pages(reader):
+            if not text.strip():
+                continue
 
-        return [Document().from_langchain_format(doc=doc) for doc in lc_documents]
+            yield Document(text=text, metadata=metadata | {"page": i + 1})
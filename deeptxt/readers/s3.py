@@ -1,22 +1,36 @@
 import os
 import re
+import logging
 import tempfile
 
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Optional, Tuple
 
-from deeptxt.core.readers import BaseReader
+from deeptxt.core.readers import BaseReader, Manifest, ManifestCommitMixin
 from deeptxt.core.document import Document
 from deeptxt.readers import DirectoryReader
 
 
-class S3Reader(BaseReader):
+class S3Reader(ManifestCommitMixin, BaseReader):
     """S3 bucket reader.
 
+    With a ``manifest_path``, only objects added or modified since the previous sync are downloaded, based on the
+    ETag and LastModified returned by the listing, so unchanged objects cost no request. Once `lazy_load` is
+    exhausted, keys of modified and deleted objects are listed in ``modified_keys`` and ``deleted_keys``. The
+    manifest is only saved by `commit`, after the documents are written. Documents carry their object ``key`` in
+    metadata.
+
     Args:
         bucket (str): Name of the S3 bucket.
         ibm_api_key_id (str): IBM Cloud API key.
         ibm_service_instance_id (str): Service instance ID for the IBM COS.
         s3_endpoint_url (str): Endpoint URL for the S3 service.
+        prefix (str, optional): Only read objects whose key starts with the prefix. Defaults to ``""``.
+        suffixes (List[str], optional): Only read objects with these suffixes. Defaults to the suffixes of the `DirectoryReader` default readers.
+        max_concurrency (int, optional): Number of objects downloaded concurrently. Defaults to ``8``.
+        small_object_size (int, optional): Objects up to this size in bytes are fetched with a single ``GET``
+            instead of the multipart transfer manager. Defaults to ``8 MiB``.
+        manifest_path (str, optional): Path of the JSON manifest of object ETags used for incremental sync.
 
     **Example**
 
@@ -28,12 +42,24 @@ class S3Reader(BaseReader):
                      ibm_api_key_id="your_api_key",
                      ibm_service_instance_id="your_instance_id",
                      s3_endpoint_url="your_api_url")
+
+        # Incremental sync
+        loader = S3Reader(bucket="your_bucket", ..., manifest_path="./index/s3_manifest.json")
+        db.upsert_documents(loader.load_data(), source_key="key")  # Replaces the chunks of modified objects
+        if loader.deleted_keys:
+            db.delete_by_metadata({"key": loader.deleted_keys})
+        loader.commit()
     """
 
     def __init__(self, bucket: str,
                  ibm_api_key_id: str = None,
                  ibm_service_instance_id: str = None,
-                 s3_endpoint_url: str = None
+                 s3_endpoint_url: str = None,
+                 prefix: str = "",
+                 suffixes: Optional[List[str]] = None,
+                 max_concurrency: int = 8,
+                 small_object_size: int = 8 * 1024 * 1024,
+                 manifest_path: str = None
                  ):
 
         try:
@@ -49,10 +75,16 @@ class S3Reader(BaseReader):
         self.ibm_api_key_id = ibm_api_key_id
         self.ibm_service_instance_id = ibm_service_instance_id
         self.s3_endpoint_url = s3_endpoint_url
-
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads data from the specified S3 bucket."""
-        ibm_s3 = self._ibm_boto3.resource(
+        self.prefix = prefix
+        self.suffixes = suffixes
+        self.max_concurrency = max_concurrency
+        self.small_object_size = small_object_size
+        self.manifest_path = manifest_path
+        self.modified_keys: List[str] = []
+        self.deleted_keys: List[str] = []
+
+    def _get_resource(self):
+        return self._ibm_boto3.resource(
             "s3",
             ibm_api_key_id=self.ibm_api_key_id,
             ibm_service_instance_id=self.ibm_service_instance_id,
@@ -60,14 +92,123 @@ class S3Reader(BaseReader):
             endpoint_url=self.s3_endpoint_url,
         )
 
+    def _download(self, client, key: str, size: int, file_path: str) -> str:
+        """Downloads one object, with a single ``GET`` for small objects."""
+        try:
+            if size <= self.small_object_size:
+                body = client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+                with open(file_path, "wb") as f:
+                    f.write(body)
+            else:
+                client.download_file(self.bucket, key, file_path)
+        except Exception:
+            os.remove(file_path)
+            raise
+
+        return file_path
+
+    def _iter_downloaded(self, client, objects: Iterator[Tuple[str, int]],
+                         temp_dir: str) -> Iterator[Tuple[str, Optional[str], Optional[Exception]]]:
+        """Downloads objects in a thread pool, yielding ``(key, file_path, error)`` as each one lands.
+
+        At most ``2 * max_concurrency`` objects are in flight, which bounds the local disk usage.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            pending = {}
+
+            def drain(return_when):
+                done, _ = wait(pending, return_when=return_when)
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        yield key, future.result(), None
+                    except Exception as e:
+                        yield key, None, e
+
+            for key, size in objects:
+                # Keys are untrusted paths, e.g. absolute or with `..`, so they are never used as local paths
+                fd, file_path = tempfile.mkstemp(dir=temp_dir, suffix=os.path.splitext(key)[1])
+                os.close(fd)
+
+                pending[executor.submit(self._download, client, key, size, file_path)] = key
+
+                if len(pending) >= 2 * self.max_concurrency:
+                    yield from drain(FIRST_COMPLETED)
+
+            while pending:
+                yield from drain(FIRST_COMPLETED)
+
+    def _iter_objects(self, bucket, suffixes: List[str],
+                      manifest: Optional[Manifest] = None) -> Iterator[Tuple[str, int]]:
+        """Lists objects to read, skipping those whose listed ETag and LastModified match the manifest."""
+        for obj in bucket.objects.filter(Prefix=self.prefix):
+            if obj.key.endswith("/") or os.path.splitext(obj.key)[1].lower() not in suffixes:
+                continue
+
+            if manifest is not None:
+                manifest.mark_seen(obj.key)
+
+                record = {"etag": obj.e_tag, "last_modified": obj.last_modified.isoformat()}
+                if manifest.get(obj.key) == record:
+                    continue
+
+                manifest.stage(obj.key, record)
+
+            yield obj.key, obj.size
+
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields the documents of each object of the S3 bucket.
+
+        Objects are downloaded concurrently to a temporary directory and each one is parsed, by the reader
+        registered for its suffix in `DirectoryReader`, as soon as it lands, then removed. Objects failing
+        to download or parse are logged and skipped.
+        """
+        ibm_s3 = self._get_resource()
+        client = ibm_s3.meta.client
         bucket = ibm_s3.Bucket(self.bucket)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for obj in bucket.objects.filter(Prefix=""):
-                file_path = f"{temp_dir}/{obj.key}"
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                ibm_s3.meta.client.download_file(self.bucket, obj.key, file_path)
+        file_reader = {suffix.lower(): reader_cls
+                       for suffix, reader_cls in DirectoryReader.default_file_reader_fn().items()}
+        suffixes = [suffix.lower() for suffix in self.suffixes] if self.suffixes else list(file_reader)
+
+        s3_source = re.sub(r"^(https?)://", "", self.s3_endpoint_url)
+        metadata = {"source": f"{s3_source}/{self.bucket}"} | (extra_info or {})
 
-            s3_source = re.sub(r"^(https?)://", "", self.s3_endpoint_url)
+        self.modified_keys = []
+        self.deleted_keys = []
 
-            return DirectoryReader(input_dir=temp_dir).load_data(extra_info={"source": f"{s3_source}/{self.bucket}"})
+        manifest = self._open_manifest(self.manifest_path)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            objects = self._iter_objects(bucket, suffixes, manifest)
+
+            for key, file_path, error in self._iter_downloaded(client, objects, temp_dir):
+                if error is not None:
+                    logging.error(f"Error downloading `{key}`: {error}")
+                    continue
+
+                reader_cls = file_reader.get(os.path.splitext(key)[1].lower())
+                try:
+                    if reader_cls is None:
+                        raise ValueError(f"No reader registered for `{key}`")
+
+                    documents = reader_cls(input_file=file_path).load_data()
+                except Exception as e:
+                    logging.error(f"Error reading `{key}`: {e}")
+                    continue
+                finally:
+                    os.remove(file_path)
+
+                # Failed objects keep their previous record, so they are read again on the next sync
+                if manifest is not None and manifest.confirm(key):
+                    self.modified_keys.append(key)
+
+                for doc in documents:
+                    doc.metadata.update(metadata)
+                    doc.metadata["key"] = key
+                    doc.metadata["filename"] = os.path.basename(key)
+                    yield doc
+
+        if manifest is not None:
+            self.deleted_keys = manifest.remove_unseen(prefix=self.prefix)
+            self._stage_manifest(manifest)
@@ -1,7 +1,9 @@
+import time
 import logging
 
 from datetime import datetime
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterator, List, Optional
 
 from deeptxt.core.readers import BaseReader
 from deeptxt.core.document import Document
@@ -12,6 +14,9 @@ class WatsonDiscoveryReader(BaseReader):
 
     See https://cloud.ibm.com/docs/discovery-data?topic=discovery-data-getting-started for more info.
 
+    The first page gives the number of matching results, the remaining pages are then fetched concurrently and
+    documents are yielded as pages arrive. Failed page requests are retried with exponential backoff.
+
     Args:
         url (str): Watson Discovery instance url.
         api_key (str): Watson Discovery API key.
@@ -20,6 +25,9 @@ class WatsonDiscoveryReader(BaseReader):
         batch_size (int, optional): Batch size for bulk operations. Defaults to ``50``.
         created_date (str, optional): Load documents created after the date. Expected format ``YYYY-MM-DD``. Defaults to ``datetime.today()``.
         pre_additional_data_field (str, optional): Additional data field to be added to the beginning of the Document content. Defaults to ``None``.
+        max_workers (int, optional): Number of pages fetched concurrently. Defaults to ``4``.
+        max_retries (int, optional): Number of retries of a failed page request. Defaults to ``3``.
+        backoff_factor (float, optional): Retries wait ``backoff_factor * 2 ** attempt`` seconds. Defaults to ``1.0``.
 
     **Example**
 
@@ -39,7 +47,10 @@ class WatsonDiscoveryReader(BaseReader):
                  version: str = "2023-03-31",
                  batch_size: int = 50,
                  created_date: str = datetime.today().strftime("%Y-%m-%d"),
-                 pre_additional_data_field: str = None
+                 pre_additional_data_field: str = None,
+                 max_workers: int = 4,
+                 max_retries: int = 3,
+                 backoff_factor: float = 1.0
                  ) -> None:
         try:
             from ibm_watson import DiscoveryV2
@@ -52,6 +63,9 @@ class WatsonDiscoveryReader(BaseReader):
         self.batch_size = batch_size
         self.created_date = created_date
         self.pre_additional_data_field = pre_additional_data_field
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
 
         try:
             authenticator = IAMAuthenticator(api_key)
@@ -63,50 +77,75 @@ class WatsonDiscoveryReader(BaseReader):
             logging.error(f"Error connecting to IBM Watson Discovery: {e}")
             raise
 
-    def load_data(self, extra_info: Optional[dict] = None) -> List[Document]:
-        """Loads documents from the Watson Discovery.
+    def lazy_load(self, extra_info: Optional[dict] = None) -> Iterator[Document]:
+        """Yields documents from the Watson Discovery as result pages arrive.
 
         **Example**
 
         .. code-block:: python
 
-            docs = reader.load_data()
+            for doc in reader.lazy_load():
+                ...
         """
+        results = self._query_page(0)
+        yield from self._to_documents(results)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = set()
+            for offset in range(self.batch_size, results["matching_results"], self.batch_size):
+                pending.add(executor.submit(self._query_page, offset))
+
+                if len(pending) >= 2 * self.max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from self._to_documents(future.result())
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from self._to_documents(future.result())
+
+    def _query_page(self, offset: int) -> dict:
+        """Queries one page of results, retrying with exponential backoff."""
         from ibm_watson.discovery_v2 import QueryLargePassages
-        last_batch_size = self.batch_size
-        offset_len = 0
-        documents = []
         return_fields = ["extracted_metadata.filename", "extracted_metadata.file_type", "text"]
 
         if self.pre_additional_data_field:
             return_fields.append(self.pre_additional_data_field)
 
-        while last_batch_size == self.batch_size:
-            results = self._client.query(
-                project_id=self.project_id,
-                count=self.batch_size,
-                offset=offset_len,
-                return_=return_fields,
-                filter="extracted_metadata.publicationdate>={}".format(self.created_date),
-                passages=QueryLargePassages(enabled=False)).get_result()
-
-            last_batch_size = len(results["results"])
-            offset_len = offset_len + last_batch_size
-
-            # Make sure all retrieved document 'text' exist
-            results_documents = [doc for doc in results["results"] if "text" in doc]
+        attempt = 0
+        while True:
+            try:
+                return self._client.query(
+                    project_id=self.project_id,
+                    count=self.batch_size,
+                    offset=offset,
+                    return_=return_fields,
+                    filter="extracted_metadata.publicationdate>={}".format(self.created_date),
+                    passages=QueryLargePassages(enabled=False)).get_result()
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    logging.error(f"Error querying IBM Watson Discovery at offset {offset}: {e}")
+                    raise
+
+                delay = self.backoff_factor * 2 ** attempt
+                logging.warning(f"Error querying IBM Watson Discovery at offset {offset}, retrying in {delay}s: {e}")
+                time.sleep(delay)
+                attempt += 1
+
+    def _to_documents(self, results: dict) -> List[Document]:
+        # Make sure all retrieved document 'text' exist
+        results_documents = [doc for doc in results["results"] if "text" in doc]
 
-            if self.pre_additional_data_field:
-                for i, doc in enumerate(results_documents):
-                    doc["text"].insert(0, self._get_nested_value(doc, self.pre_additional_data_field))
-
-            documents.extend([Document(doc_id=doc["document_id"],
-                                       text="\n".join(doc["text"]),
-                                       metadata={"collection_id": doc["result_metadata"]["collection_id"]} | doc[
-                                           "extracted_metadata"])
-                              for doc in results_documents])
-
-        return documents
+        if self.pre_additional_data_field:
+            for i, doc in enumerate(results_documents):
+                doc["text"].insert(0, self._get_nested_value(doc, self.pre_additional_data_field))
+
+        return [Document(doc_id=doc["document_id"],
+                         text="\n".join(doc["text"]),
+                         metadata={"collection_id": doc["result_metadata"]["collection_id"]} | doc[
+                             "extracted_metadata"])
+                for doc in results_documents]
 
     @staticmethod
     def _get_nested_value(d, key_path, separator: Optional[str] = "."):
@@ -1,7 +1,11 @@
 from deeptxt.vector_stores.elasticsearch import ElasticsearchVectorStore
+from deeptxt.vector_stores.async_elasticsearch import AsyncElasticsearchVectorStore
 from deeptxt.vector_stores.chroma import ChromaVectorStore
+from deeptxt.vector_stores.hnsw import HNSWVectorStore
 
 __all__ = [
+    "AsyncElasticsearchVectorStore",
     "ChromaVectorStore",
     "ElasticsearchVectorStore",
+    "HNSWVectorStore",
 ]
@@ -0,0 +1,300 @@
+import asyncio
+import logging
+
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from deeptxt.core.document import Document, DocumentWithScore
+from deeptxt.core.embeddings import BaseEmbedding
+from deeptxt.core.vector_stores.cache import QueryCache, invalidate_cache
+from deeptxt.core.vector_stores.filters import MetadataFilters
+from deeptxt.vector_stores.elasticsearch import _BaseElasticsearchVectorStore, _BulkResults
+
+
+class AsyncElasticsearchVectorStore(_BaseElasticsearchVectorStore):
+    """Asyncio counterpart of `ElasticsearchVectorStore`, built on ``AsyncElasticsearch``.
+
+    A single client, and its connection pool, is shared by every coroutine using the store.
+    Embeddings are computed in a worker thread so they don't block the event loop.
+
+    Args:
+        index_name (str): Name of the Elasticsearch index.
+        url (str): Elasticsearch instance url.
+        user (str): Elasticsearch username.
+        password (str): Elasticsearch password.
+        dims_length (int): Length of the embedding dimensions.
+        embed_model (BaseEmbedding):
+        batch_size (int, optional): Batch size for bulk operations. Defaults to ``200``.
+        ssl (bool, optional): Whether to use SSL. Defaults to ``False``.
+        distance_strategy (str, optional): Distance strategy for similarity search. Defaults to ``cosine``.
+        text_field (str, optional): Name of the field containing text. Defaults to ``text``.
+        vector_field (str, optional): Name of the field containing vector embeddings. Defaults to ``embedding``.
+        index_type (str, optional): ``dense_vector`` index type, e.g. ``hnsw``, ``int8_hnsw``, ``int4_hnsw`` or ``bbq_hnsw``. Defaults to the cluster default.
+        m (int, optional): Number of neighbors of each node in the HNSW graph, requires ``index_type``. Defaults to the cluster default.
+        ef_construction (int, optional): Number of candidates tracked while building the HNSW graph, requires ``index_type``. Defaults to the cluster default.
+        num_candidates (int, optional): Default number of kNN candidates per shard, can be overridden per query. Defaults to ``top_k * 10``.
+        number_of_shards (int, optional): Number of primary shards of the index. Defaults to the cluster default.
+        number_of_replicas (int, optional): Number of replicas of the index. Defaults to the cluster default.
+        refresh_interval (str, optional): Index refresh interval, e.g. ``30s``. Defaults to the cluster default.
+        cache (QueryCache, optional): Query result cache, cleared whenever documents are added or deleted.
+        connections_per_node (int, optional): Size of the connection pool for each node. Defaults to ``10``.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.embeddings import HuggingFaceEmbedding
+        from deeptxt.vector_stores import AsyncElasticsearchVectorStore
+
+        embedding = HuggingFaceEmbedding()
+
+        async with AsyncElasticsearchVectorStore(index_name="your_index",
+                                                 url="your_url",
+                                                 user="your_user",
+                                                 password="your_password",
+                                                 dims_length=384,
+                                                 embed_model=embedding) as db:
+            docs = await db.query("What's Deep Text")
+    """
+
+    def __init__(self,
+                 index_name: str,
+                 url: str,
+                 user: str,
+                 password: str,
+                 dims_length: int,
+                 embed_model: BaseEmbedding,
+                 batch_size: int = 200,
+                 ssl: bool = False,
+                 distance_strategy: str = "cosine",
+                 text_field: str = "text",
+                 vector_field: str = "embedding",
+                 index_type: Optional[str] = None,
+                 m: Optional[int] = None,
+                 ef_construction: Optional[int] = None,
+                 num_candidates: Optional[int] = None,
+                 number_of_shards: Optional[int] = None,
+                 number_of_replicas: Optional[int] = None,
+                 refresh_interval: Optional[str] = None,
+                 cache: Optional[QueryCache] = None,
+                 connections_per_node: int = 10,
+                 ) -> None:
+        try:
+            from elasticsearch import AsyncElasticsearch
+            from elasticsearch.helpers import async_bulk, async_streaming_bulk
+
+            self._es_async_bulk = async_bulk
+            self._es_async_streaming_bulk = async_streaming_bulk
+        except ImportError:
+            raise ImportError("elasticsearch package not found, please install it with `pip install elasticsearch[async]`")
+
+        super().__init__(index_name=index_name,
+                         dims_length=dims_length,
+                         embed_model=embed_model,
+                         batch_size=batch_size,
+                         distance_strategy=distance_strategy,
+                         text_field=text_field,
+                         vector_field=vector_field,
+                         index_type=index_type,
+                         m=m,
+                         ef_construction=ef_construction,
+                         num_candidates=num_candidates,
+                         number_of_shards=number_of_shards,
+                         number_of_replicas=number_of_replicas,
+                         refresh_interval=refresh_interval,
+                         cache=cache)
+
+        self._client = AsyncElasticsearch(
+            hosts=[url],
+            basic_auth=(
+                user,
+                password
+            ),
+            verify_certs=ssl,
+            ssl_show_warn=False,
+            connections_per_node=connections_per_node
+        )
+
+    async def __aenter__(self) -> "AsyncElasticsearchVectorStore":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        await self._client.close()
+
+    async def _create_index_if_not_exists(self) -> None:
+        """Creates the Elasticsearch index if it doesn't already exist."""
+        if await self._client.indices.exists(index=self.index_name):
+            logging.info(f"Index {self.index_name} already exists. Skipping creation.")
+
+        else:
+            index_mappings = self._build_index_mappings()
+
+            print(f"Creating index {self.index_name}")
+
+            await self._client.indices.create(index=self.index_name,
+                                              mappings=index_mappings,
+                                              settings=self._build_index_settings() or None)
+
+    @asynccontextmanager
+    async def bulk_load(self, refresh_interval: str = "-1", number_of_replicas: int = 0) -> AsyncIterator[None]:
+        """Async context manager relaxing the index settings during a bulk load, restoring them and refreshing on exit.
+
+        Args:
+            refresh_interval (str, optional): Refresh interval during the load, ``-1`` disables refreshes. Defaults to ``-1``.
+            number_of_replicas (int, optional): Number of replicas during the load. Defaults to ``0``.
+        """
+        await self._create_index_if_not_exists()
+
+        response = await self._client.indices.get_settings(index=self.index_name)
+        relaxed, previous = self._build_bulk_load_settings(response, refresh_interval, number_of_replicas)
+
+        await self._client.indices.put_settings(index=self.index_name, settings=relaxed)
+        try:
+            yield
+        finally:
+            await self._client.indices.put_settings(index=self.index_name, settings=previous)
+            await self._client.indices.refresh(index=self.index_name)
+
+    async def add_documents(self, documents: List[Document],
+                            create_index_if_not_exists: bool = True,
+                            refresh: bool = True) -> List[dict]:
+        """Add documents to the Elasticsearch index with ``async_streaming_bulk``.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to add to the index.
+            create_index_if_not_exists (bool, optional): Whether to create the index if it doesn't exist. Defaults to ``True``.
+            refresh (bool, optional): Whether to refresh the index once all documents are added. Defaults to ``True``.
+
+        Returns:
+            List[dict]: Bulk items that failed to be indexed.
+        """
+        if create_index_if_not_exists:
+            await self._create_index_if_not_exists()
+
+        with invalidate_cache(self._cache):
+            bulk_results = _BulkResults(self.index_name)
+            async for ok, item in self._es_async_streaming_bulk(self._client,
+                                                                self._generate_actions(documents),
+                                                                chunk_size=self.batch_size,
+                                                                raise_on_error=False,
+                                                                raise_on_exception=False):
+                bulk_results.add(ok, item)
+
+            if refresh:
+                await self._client.indices.refresh(index=self.index_name)
+
+            return bulk_results.report()
+
+    async def _generate_actions(self, documents: List[Document]) -> AsyncIterator[dict]:
+        """Lazily yields bulk index actions, embedding documents one batch at a time."""
+        for i in range(0, len(documents), self.batch_size):
+            batch = documents[i:i + self.batch_size]
+            embeddings = await asyncio.to_thread(self._embed_model.get_documents_embedding, batch)
+
+            for doc, embedding in zip(batch, embeddings):
+                yield self._to_action(doc, embedding)
+
+    async def query(self, query: str, top_k: int = 4,
+                    filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                    num_candidates: Optional[int] = None) -> List[DocumentWithScore]:
+        """Performs a similarity search for top-k most similar documents.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of top results to return. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied inside the kNN search.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k, filter, num_candidates=num_candidates)
+            if cached is not None:
+                return cached
+
+        query_embedding = await asyncio.to_thread(self._embed_model.get_query_embedding, query)
+
+        if self._cache is not None:
+            cached = self._cache.get_similar(query_embedding, top_k, filter, num_candidates=num_candidates)
+            if cached is not None:
+                return cached
+
+        results = await self._client.search(index=self.index_name,
+                                            **self._build_search_body(query_embedding, top_k, filter, num_candidates))
+        docs_and_scores = self._to_documents_with_score(results["hits"]["hits"])
+
+        if self._cache is not None:
+            self._cache.put(query, top_k, filter, docs_and_scores, query_embedding, num_candidates=num_candidates)
+
+        return docs_and_scores
+
+    async def query_batch(self, queries: List[str], top_k: int = 4,
+                          filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                          num_candidates: Optional[int] = None) -> List[List[DocumentWithScore]]:
+        """Performs a similarity search for several queries in a single ``_msearch`` request.
+
+        Args:
+            queries (List[str]): List of query texts.
+            top_k (int, optional): Number of top results to return per query. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied to every query.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+
+        Returns:
+            List[List[DocumentWithScore]]: Results of each query, in the order of ``queries``.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = await asyncio.to_thread(self._embed_model.get_texts_embedding, queries)
+        searches = self._build_msearch_body(query_embeddings, top_k, filter, num_candidates)
+
+        responses = (await self._client.msearch(searches=searches))["responses"]
+
+        return self._parse_msearch_responses(queries, responses)
+
+    async def max_marginal_relevance_search(self, query: str, top_k: int = 4,
+                                            fetch_k: int = 20,
+                                            lambda_mult: float = 0.5,
+                                            filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                                            num_candidates: Optional[int] = None) -> List[DocumentWithScore]:
+        """Performs a Maximal Marginal Relevance (MMR) search, trading similarity to the query for diversity.
+
+        The ``fetch_k`` candidates are retrieved together with their vectors in a single kNN search.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of results to return. Defaults to ``4``.
+            fetch_k (int, optional): Number of candidates to select from. Defaults to ``20``.
+            lambda_mult (float, optional): Trade-off between relevance (``1``) and diversity (``0``). Defaults to ``0.5``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied inside the kNN search.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+        """
+        query_embedding = await asyncio.to_thread(self._embed_model.get_query_embedding, query)
+
+        body = self._build_search_body(query_embedding, max(fetch_k, top_k), filter, num_candidates)
+        body["_source"] = True
+
+        results = await self._client.search(index=self.index_name, **body)
+
+        return self._select_mmr_hits(query_embedding, results["hits"]["hits"], top_k, lambda_mult)
+
+    async def delete_documents(self, ids: List[str] = None, refresh: bool = True) -> None:
+        """Delete documents from the Elasticsearch index through the bulk API.
+
+        Args:
+            ids (List[str]): List of `Document` IDs to delete.
+            refresh (bool, optional): Whether to refresh the index once all documents are deleted. Defaults to ``True``.
+        """
+        if not ids:
+            raise ValueError("No ids provided to delete.")
+
+        with invalidate_cache(self._cache):
+            actions = ({"_op_type": "delete", "_index": self.index_name, "_id": _id} for _id in ids)
+
+            _, errors = await self._es_async_bulk(self._client, actions,
+                                                  chunk_size=self.batch_size,
+                                                  raise_on_error=False,
+                                                  refresh=refresh)
+
+        self._log_delete_errors(errors)
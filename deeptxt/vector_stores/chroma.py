@@ -1,18 +1,33 @@
 import uuid
 import logging
 
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 from deeptxt.core.document import Document, DocumentWithScore
 from deeptxt.core.embeddings import BaseEmbedding
+from deeptxt.core.vector_stores.cache import QueryCache, invalidate_cache
+from deeptxt.core.vector_stores.filters import MetadataFilters, to_metadata_filters
+from deeptxt.core.vector_stores.utils import diff_documents, get_sources, maximal_marginal_relevance
 
 
 class ChromaVectorStore:
     """Chroma is the AI-native open-source vector database. Embeddings are stored within a ChromaDB collection.
 
+    The client is in-memory by default, persisted to ``persist_directory`` when given, or connected to a Chroma
+    server when ``host`` is given. An existing collection with the same name is reused, provided its distance
+    strategy matches.
+
     Args:
         embed_model (BaseEmbedding):
-        collection_name (str, optional): Name of the ChromaDB collection.
+        collection_name (str, optional): Name of the ChromaDB collection. Defaults to ``deeptxt`` for persistent and HTTP clients, auto-generated otherwise.
         distance_strategy (str, optional): Distance strategy for similarity search. Defaults to ``cosine``.
+        persist_directory (str, optional): Local path where the collection is persisted.
+        host (str, optional): Host of a Chroma server.
+        port (int, optional): Port of the Chroma server. Defaults to ``8000``.
+        hnsw_m (int, optional): Maximum number of neighbors of each node in the HNSW graph (``hnsw:M``).
+        hnsw_construction_ef (int, optional): Number of candidates tracked while building the graph (``hnsw:construction_ef``).
+        hnsw_search_ef (int, optional): Number of candidates tracked while searching (``hnsw:search_ef``).
+        batch_size (int, optional): Number of documents embedded and written per batch. Defaults to ``200``.
+        cache (QueryCache, optional): Query result cache, cleared whenever documents are added or deleted.
 
     **Example**
 
@@ -23,11 +38,22 @@ class ChromaVectorStore:
 
         embedding = HuggingFaceEmbedding()
         db = ChromaVectorStore(embed_model=embedding)
+
+        # Persisted collection, reused across restarts
+        db = ChromaVectorStore(embed_model=embedding, collection_name="docs", persist_directory="./chroma")
     """
 
     def __init__(self, embed_model: BaseEmbedding,
                  collection_name: str = None,
-                 distance_strategy: str = "cosine") -> None:
+                 distance_strategy: str = "cosine",
+                 persist_directory: str = None,
+                 host: str = None,
+                 port: int = 8000,
+                 hnsw_m: int = None,
+                 hnsw_construction_ef: int = None,
+                 hnsw_search_ef: int = None,
+                 batch_size: int = 200,
+                 cache: Optional[QueryCache] = None) -> None:
         try:
             import chromadb
             import chromadb.config
@@ -36,60 +62,254 @@ class ChromaVectorStore:
             raise ImportError("chromadb package not found, please install it with `pip install chromadb`")
 
         self._embed_model = embed_model
+        self.batch_size = batch_size
+        self._cache = cache
         self._client_settings = chromadb.config.Settings()
-        self._client = chromadb.Client(self._client_settings)
 
         if distance_strategy not in ["cosine", "ip", "l2"]:
             raise ValueError(f"Similarity {distance_strategy} not supported.")
 
+        if persist_directory is not None and host is not None:
+            raise ValueError("Only one of `persist_directory` and `host` can be provided.")
+
+        if host is not None:
+            self._client = chromadb.HttpClient(host=host, port=port, settings=self._client_settings)
+        elif persist_directory is not None:
+            self._client = chromadb.PersistentClient(path=persist_directory, settings=self._client_settings)
+        else:
+            self._client = chromadb.Client(self._client_settings)
+
         if collection_name is None:
-            collection_name = "auto-generated-" + str(uuid.uuid4())[:8]
+            if host is not None or persist_directory is not None:
+                collection_name = "deeptxt"
+            else:
+                collection_name = "auto-generated-" + str(uuid.uuid4())[:8]
             logging.info(f"collection_name: {collection_name}")
 
+        collection_metadata = {"hnsw:space": distance_strategy}
+        for key, value in [("hnsw:M", hnsw_m),
+                           ("hnsw:construction_ef", hnsw_construction_ef),
+                           ("hnsw:search_ef", hnsw_search_ef)]:
+            if value is not None:
+                collection_metadata[key] = value
+
         self._collection = self._client.get_or_create_collection(
             name=collection_name,
             embedding_function=None,
-            metadata={"hnsw:space": distance_strategy}
+            metadata=collection_metadata
         )
 
-    def add_documents(self, documents: List[Document]) -> List:
-        """Add documents to the ChromaDB collection.
+        # An existing collection keeps the metadata it was created with
+        existing_metadata = self._collection.metadata or {}
+        existing_space = existing_metadata.get("hnsw:space", "l2")
+        if existing_space != distance_strategy:
+            raise ValueError(f"Collection {collection_name} already exists with distance strategy {existing_space}, "
+                             f"got {distance_strategy}.")
+
+        for key, value in collection_metadata.items():
+            if key in existing_metadata and existing_metadata[key] != value:
+                logging.warning(f"Collection {collection_name} already exists with {key}={existing_metadata[key]}, "
+                                f"ignoring {value}.")
+
+        logging.info(f"Collection {collection_name} has {self._collection.count()} documents.")
+
+    def add_documents(self, documents: List[Document], show_progress: bool = False) -> List:
+        """Add documents to the ChromaDB collection, replacing documents with the same ID.
+
+        Documents are embedded in batches of ``batch_size`` and each batch is written as soon as it is embedded,
+        never exceeding the maximum batch size accepted by ChromaDB.
 
         Args:
             documents (List[Document]): List of `Document` objects to add to the collection.
+            show_progress (bool, optional): Whether to show a progress bar. Defaults to ``False``.
+        """
+        with invalidate_cache(self._cache):
+            ids = []
+            batch_size = min(self.batch_size, self._get_max_batch_size())
+            batches = range(0, len(documents), batch_size)
+
+            if show_progress:
+                try:
+                    from tqdm import tqdm
+                except ImportError:
+                    raise ImportError("tqdm package not found, please install it with `pip install tqdm`")
+
+                batches = tqdm(batches, total=len(batches), unit="batch", desc="Adding documents")
+
+            for i in batches:
+                batch = documents[i:i + batch_size]
+                batch_ids = [doc.doc_id if doc.doc_id else str(uuid.uuid4()) for doc in batch]
+
+                self._collection.upsert(embeddings=self._embed_model.get_documents_embedding(batch),
+                                        ids=batch_ids,
+                                        metadatas=[doc.get_metadata() if doc.get_metadata() else None for doc in batch],
+                                        documents=[doc.get_content() for doc in batch])
+
+                ids.extend(batch_ids)
+                logging.info(f"Added {len(ids)}/{len(documents)} documents to `{self._collection.name}`")
+
+            return ids
+
+    def upsert_documents(self, documents: List[Document],
+                         source_key: str = "filename",
+                         delete_orphans: bool = True) -> Dict[str, List[str]]:
+        """Incrementally add documents, embedding and writing only the new or changed ones.
+
+        Stored versions are fetched in bulk with ``get`` and compared by content fingerprint (see `Document.hash`),
+        so documents need stable IDs, e.g. from `Document.with_content_id`. Stored documents sharing a source with
+        the incoming ones, but absent from them, are deleted as orphans.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to upsert.
+            source_key (str, optional): Metadata key identifying the source of a document. Defaults to ``filename``.
+            delete_orphans (bool, optional): Whether to delete orphaned documents of the same sources. Defaults to ``True``.
+
+        Returns:
+            Dict[str, List[str]]: IDs ``added``, ``updated``, ``unchanged`` and ``deleted``.
         """
-        embeddings = []
-        metadatas = []
-        ids = []
-        chroma_documents = []
+        stored_hashes = {}
+        batch_size = self._get_max_batch_size()
+        for i in range(0, len(documents), batch_size):
+            stored = self._collection.get(ids=[doc.doc_id for doc in documents[i:i + batch_size]],
+                                          include=["documents", "metadatas"])
 
-        for doc in documents:
-            embeddings.append(self._embed_model.get_query_embedding(doc.get_content()))
-            metadatas.append(doc.get_metadata() if doc.get_metadata() else None)
-            ids.append(doc.doc_id if doc.doc_id else str(uuid.uuid4()))
-            chroma_documents.append(doc.get_content())
+            for _id, text, metadata in zip(stored["ids"], stored["documents"], stored["metadatas"]):
+                stored_hashes[_id] = Document(text=text, metadata=metadata).hash
 
-        self._collection.add(embeddings=embeddings,
-                             ids=ids,
-                             metadatas=metadatas,
-                             documents=chroma_documents)
+        changed, result = diff_documents(documents, stored_hashes)
+        if changed:
+            self.add_documents(changed)
 
-        return ids
+        result["deleted"] = []
+        sources = get_sources(documents, source_key)
+        if delete_orphans and sources:
+            ids = {doc.doc_id for doc in documents}
+            stored = self._collection.get(where={source_key: {"$in": sources}}, include=[])
 
-    def query(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
+            result["deleted"] = [_id for _id in stored["ids"] if _id not in ids]
+            if result["deleted"]:
+                self.delete_documents(result["deleted"])
+
+        return result
+
+    def _get_max_batch_size(self) -> int:
+        """Maximum number of records accepted by a single ChromaDB write."""
+        if hasattr(self._client, "get_max_batch_size"):
+            return self._client.get_max_batch_size()
+
+        return getattr(self._client, "max_batch_size", self.batch_size)
+
+    def query(self, query: str, top_k: int = 4,
+              filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[DocumentWithScore]:
         """Performs a similarity search for top-k most similar documents.
 
         Args:
             query (str): Query text.
             top_k (int, optional): Number of top results to return. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter, compiled to a Chroma ``where`` clause.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k, filter)
+            if cached is not None:
+                return cached
+
+        query_embedding = self._embed_model.get_query_embedding(query)
+
+        if self._cache is not None:
+            cached = self._cache.get_similar(query_embedding, top_k, filter)
+            if cached is not None:
+                return cached
+
+        results = self._collection.query(
+            query_embeddings=query_embedding,
+            n_results=top_k,
+            where=self._to_chroma_where(to_metadata_filters(filter))
+        )
+        docs_and_scores = self._to_documents_with_score(results, 0)
+
+        if self._cache is not None:
+            self._cache.put(query, top_k, filter, docs_and_scores, query_embedding)
+
+        return docs_and_scores
+
+    def query_batch(self, queries: List[str], top_k: int = 4,
+                    filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[List[DocumentWithScore]]:
+        """Performs a similarity search for several queries in a single collection query.
+
+        Args:
+            queries (List[str]): List of query texts.
+            top_k (int, optional): Number of top results to return per query. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied to every query.
+
+        Returns:
+            List[List[DocumentWithScore]]: Results of each query, in the order of ``queries``.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self._embed_model.get_texts_embedding(queries)
+
+        results = self._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k,
+            where=self._to_chroma_where(to_metadata_filters(filter))
+        )
+
+        return [self._to_documents_with_score(results, i) for i in range(len(queries))]
+
+    def max_marginal_relevance_search(self, query: str, top_k: int = 4,
+                                      fetch_k: int = 20,
+                                      lambda_mult: float = 0.5,
+                                      filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[DocumentWithScore]:
+        """Performs a Maximal Marginal Relevance (MMR) search, trading similarity to the query for diversity.
+
+        The ``fetch_k`` candidates are retrieved together with their embeddings in a single collection query.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of results to return. Defaults to ``4``.
+            fetch_k (int, optional): Number of candidates to select from. Defaults to ``20``.
+            lambda_mult (float, optional): Trade-off between relevance (``1``) and diversity (``0``). Defaults to ``0.5``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter, compiled to a Chroma ``where`` clause.
         """
         query_embedding = self._embed_model.get_query_embedding(query)
 
         results = self._collection.query(
             query_embeddings=query_embedding,
-            n_results=top_k
+            n_results=max(fetch_k, top_k),
+            where=self._to_chroma_where(to_metadata_filters(filter)),
+            include=["documents", "metadatas", "distances", "embeddings"]
         )
+        docs_and_scores = self._to_documents_with_score(results, 0)
+        if not docs_and_scores:
+            return []
+
+        selected = maximal_marginal_relevance(query_embedding, results["embeddings"][0], top_k, lambda_mult)
+
+        return [docs_and_scores[i] for i in selected]
+
+    @staticmethod
+    def _to_chroma_where(filters: MetadataFilters = None) -> Union[Dict, None]:
+        """Compiles a `MetadataFilters` expression to a Chroma ``where`` clause."""
+        if not filters or not filters.filters:
+            return None
+
+        clauses = []
+        for f in filters.filters:
+            if isinstance(f, MetadataFilters):
+                clauses.append(ChromaVectorStore._to_chroma_where(f))
+            else:
+                clauses.append({f.key: {f"${f.operator}": f.value}})
+
+        # Chroma requires at least two clauses in `$and`/`$or`
+        if len(clauses) == 1:
+            return clauses[0]
+
+        return {f"${filters.condition}": clauses}
 
+    @staticmethod
+    def _to_documents_with_score(results: dict, i: int) -> List[DocumentWithScore]:
+        """Converts the results of the i-th query embedding."""
         return [
             DocumentWithScore(document=Document(
                 doc_id=result[0],
@@ -97,10 +317,10 @@ class ChromaVectorStore:
                 metadata=result[2]
             ), score=result[3])
             for result in zip(
-                results["ids"][0],
-                results["documents"][0],
-                results["metadatas"][0],
-                results["distances"][0],
+                results["ids"][i],
+                results["documents"][i],
+                results["metadatas"][i],
+                results["distances"][i],
             )
         ]
 
@@ -113,4 +333,5 @@ class ChromaVectorStore:
         if not ids:
             raise ValueError("No ids provided to delete.")
 
-        self._collection.delete(ids=ids)
+        with invalidate_cache(self._cache):
+            self._collection.delete(ids=ids)
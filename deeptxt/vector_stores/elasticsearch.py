@@ -1,12 +1,290 @@
+import time
 import uuid
 import logging
 
-from typing import List
+from datetime import date, datetime
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Literal, Optional, Tuple, Union
 from deeptxt.core.document import Document, DocumentWithScore
 from deeptxt.core.embeddings import BaseEmbedding
+from deeptxt.core.vector_stores.cache import QueryCache, invalidate_cache
+from deeptxt.core.vector_stores.filters import MetadataFilters, to_metadata_filters
+from deeptxt.core.vector_stores.utils import diff_documents, get_sources, maximal_marginal_relevance
 
 
-class ElasticsearchVectorStore:
+_INDEX_TYPES = ["hnsw", "int8_hnsw", "int4_hnsw", "bbq_hnsw", "flat", "int8_flat", "int4_flat", "bbq_flat"]
+
+# Metadata keys mapped as ``date``, whose range filters may compare date strings
+_DATE_FIELDS = ["creation_date"]
+
+
+class _BulkResults:
+    """Counts the results of bulk index actions as they stream in, logging and collecting the failed items."""
+
+    def __init__(self, index_name: str) -> None:
+        self.index_name = index_name
+        self.added = 0
+        self.failed: List[dict] = []
+
+    def add(self, ok: bool, item: dict) -> None:
+        if ok:
+            self.added += 1
+        else:
+            logging.error(f"Failed to index document: {item}")
+            self.failed.append(item)
+
+    def report(self) -> List[dict]:
+        """Logs the totals, returning the failed items."""
+        print(f"Added {self.added} documents to `{self.index_name}`")
+        if self.failed:
+            logging.warning(f"Failed to add {len(self.failed)} documents to `{self.index_name}`")
+
+        return self.failed
+
+
+class _BaseElasticsearchVectorStore:
+    """Client-independent request building shared by the sync and async Elasticsearch vector stores."""
+
+    def __init__(self,
+                 index_name: str,
+                 dims_length: int,
+                 embed_model: BaseEmbedding,
+                 batch_size: int = 200,
+                 distance_strategy: str = "cosine",
+                 text_field: str = "text",
+                 vector_field: str = "embedding",
+                 index_type: Optional[str] = None,
+                 m: Optional[int] = None,
+                 ef_construction: Optional[int] = None,
+                 num_candidates: Optional[int] = None,
+                 number_of_shards: Optional[int] = None,
+                 number_of_replicas: Optional[int] = None,
+                 refresh_interval: Optional[str] = None,
+                 cache: Optional[QueryCache] = None,
+                 ) -> None:
+        if index_type is not None and index_type not in _INDEX_TYPES:
+            raise ValueError(f"Index type {index_type} not supported.")
+
+        # Options are written with their type, which would override the cluster default, e.g. ``int8_hnsw``
+        if (m or ef_construction) and index_type is None:
+            raise ValueError("`m` and `ef_construction` require an HNSW `index_type`, e.g. `int8_hnsw`.")
+
+        if (m or ef_construction) and not index_type.endswith("hnsw"):
+            raise ValueError(f"`m` and `ef_construction` are not supported by index type {index_type}.")
+
+        self._embed_model = embed_model
+        self.index_name = index_name
+        self.batch_size = batch_size
+        self.dims_length = dims_length
+        self.distance_strategy = distance_strategy
+        self.vector_field = vector_field
+        self.text_field = text_field
+        self.index_type = index_type
+        self.m = m
+        self.ef_construction = ef_construction
+        self.num_candidates = num_candidates
+        self.number_of_shards = number_of_shards
+        self.number_of_replicas = number_of_replicas
+        self.refresh_interval = refresh_interval
+        self._cache = cache
+
+    def _build_index_mappings(self) -> dict:
+        """Builds the index mappings."""
+        if self.dims_length is None:
+            raise ValueError(
+                "Cannot create index without specifying dims_length. "
+                "When the index doesn't already exist."
+            )
+
+        if self.distance_strategy not in ["cosine", "dot_product", "l2_norm"]:
+            raise ValueError(f"Similarity {self.distance_strategy} not supported.")
+
+        vector_mapping = {
+            "type": "dense_vector",
+            "dims": self.dims_length,
+            "index": True,
+            "similarity": self.distance_strategy,
+        }
+
+        # Without an index type, let Elasticsearch pick its default for the cluster version
+        if self.index_type:
+            index_options = {"type": self.index_type}
+            if self.m:
+                index_options["m"] = self.m
+            if self.ef_construction:
+                index_options["ef_construction"] = self.ef_construction
+
+            vector_mapping["index_options"] = index_options
+
+        return {
+            "properties": {
+                self.text_field: {"type": "text"},
+                self.vector_field: vector_mapping,
+                "metadata": {
+                    "properties": {
+                        "creation_date": {"type": "date", "format": "strict_date_optional_time||epoch_millis",
+                                          "ignore_malformed": True},
+                        "filename": {"type": "keyword"},
+                        "file_type": {"type": "keyword"},
+                        "page": {"type": "integer", "ignore_malformed": True},
+                    }
+                }
+            },
+            # Other string metadata, e.g. ``source`` or ``key``, is matched exactly by `term` filters. Longer values,
+            # e.g. joined headings, stay in ``_source`` but aren't indexed, as they could exceed the 32766-byte term limit
+            "dynamic_templates": [{
+                "metadata_strings": {
+                    "path_match": "metadata.*",
+                    "match_mapping_type": "string",
+                    "mapping": {"type": "keyword", "ignore_above": 8191},
+                }
+            }],
+        }
+
+    def _build_index_settings(self) -> dict:
+        """Builds the index settings."""
+        settings = {
+            "number_of_shards": self.number_of_shards,
+            "number_of_replicas": self.number_of_replicas,
+            "refresh_interval": self.refresh_interval,
+        }
+
+        return {key: value for key, value in settings.items() if value is not None}
+
+    def _to_action(self, doc: Document, embedding: List[float]) -> dict:
+        """Builds the bulk index action of a document."""
+        _metadata = doc.get_metadata()
+
+        return {
+            "_index": self.index_name,
+            "_id": doc.doc_id if doc.doc_id else str(uuid.uuid4()),
+            self.text_field: doc.get_content(),
+            self.vector_field: embedding,
+            "metadata": _metadata,
+            "metadata.creation_date": _metadata.get("creation_date") or None,
+            "metadata.filename": _metadata.get("filename") or None,
+            "metadata.file_type": _metadata.get("file_type") or None,
+            "metadata.page": _metadata.get("page") or None,
+        }
+
+    def _build_search_body(self, query_embedding: List[float], top_k: int,
+                           filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                           num_candidates: Optional[int] = None) -> dict:
+        """Builds the kNN search request body."""
+        num_candidates = num_candidates or self.num_candidates or top_k * 10
+
+        knn = {
+            "field": self.vector_field,
+            "query_vector": query_embedding,
+            "k": top_k,
+            "num_candidates": max(num_candidates, top_k),
+        }
+
+        filter = to_metadata_filters(filter)
+        if filter:
+            knn["filter"] = self._to_elasticsearch_filter(filter)
+
+        return {
+            "knn": knn,
+            "size": top_k,
+            "_source": {"excludes": [self.vector_field]},
+        }
+
+    def _select_mmr_hits(self, query_embedding: List[float], hits: List[dict],
+                         top_k: int, lambda_mult: float) -> List[DocumentWithScore]:
+        """Runs MMR over hits whose ``_source`` includes the vector field."""
+        if not hits:
+            return []
+
+        embeddings = [hit["_source"][self.vector_field] for hit in hits]
+        selected = maximal_marginal_relevance(query_embedding, embeddings, top_k, lambda_mult)
+
+        return self._to_documents_with_score([hits[i] for i in selected])
+
+    @staticmethod
+    def _to_elasticsearch_filter(filters: MetadataFilters) -> dict:
+        """Compiles a `MetadataFilters` expression to an Elasticsearch bool query on ``metadata.<key>`` fields."""
+        clauses = []
+        for f in filters.filters:
+            if isinstance(f, MetadataFilters):
+                clauses.append(_BaseElasticsearchVectorStore._to_elasticsearch_filter(f))
+            elif f.operator == "eq":
+                clauses.append({"term": {f"metadata.{f.key}": f.value}})
+            elif f.operator == "in":
+                clauses.append({"terms": {f"metadata.{f.key}": f.value}})
+            else:
+                value = f.value.isoformat() if isinstance(f.value, (date, datetime)) else f.value
+
+                # Ranges over keyword fields would compare strings lexicographically
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if not is_number and not (isinstance(value, str) and f.key in _DATE_FIELDS):
+                    raise ValueError(f"Range filters on `{f.key}` must compare a number, got {value!r}.")
+
+                clauses.append({"range": {f"metadata.{f.key}": {f.operator: value}}})
+
+        if filters.condition == "or":
+            return {"bool": {"should": clauses, "minimum_should_match": 1}}
+
+        return {"bool": {"filter": clauses}}
+
+    def _to_documents_with_score(self, hits: List[dict]) -> List[DocumentWithScore]:
+        return [DocumentWithScore(
+            document=Document(
+                doc_id=hit["_id"],
+                text=hit["_source"][self.text_field],
+                metadata=hit["_source"]["metadata"],
+            ),
+            score=hit["_score"])
+            for hit in hits
+        ]
+
+    def _build_bulk_load_settings(self, response: dict, refresh_interval: str,
+                                  number_of_replicas: int) -> Tuple[dict, dict]:
+        """Builds the settings relaxed during a bulk load, and the current ones to restore from ``get_settings``."""
+        settings = response[self.index_name]["settings"]["index"]
+        previous = {
+            "refresh_interval": settings.get("refresh_interval"),
+            "number_of_replicas": settings.get("number_of_replicas"),
+        }
+
+        relaxed = {"refresh_interval": refresh_interval, "number_of_replicas": number_of_replicas}
+
+        return {"index": relaxed}, {"index": previous}
+
+    def _build_msearch_body(self, query_embeddings: List[List[float]], top_k: int,
+                            filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                            num_candidates: Optional[int] = None) -> List[dict]:
+        """Builds the ``_msearch`` header and body pairs of a kNN search per query."""
+        searches = []
+        for query_embedding in query_embeddings:
+            searches.append({"index": self.index_name})
+            searches.append(self._build_search_body(query_embedding, top_k, filter, num_candidates))
+
+        return searches
+
+    def _parse_msearch_responses(self, queries: List[str], responses: List[dict]) -> List[List[DocumentWithScore]]:
+        """Results of each query of an ``_msearch`` request, empty for the queries that failed."""
+        batch_results = []
+        for query, response in zip(queries, responses):
+            if "error" in response:
+                logging.error(f"Error searching `{query}`: {response['error']}")
+                batch_results.append([])
+            else:
+                batch_results.append(self._to_documents_with_score(response["hits"]["hits"]))
+
+        return batch_results
+
+    @staticmethod
+    def _log_delete_errors(errors: List[dict]) -> None:
+        """Logs the failed bulk delete actions, ignoring documents that were not found."""
+        for error in errors:
+            if error["delete"].get("status") == 404:
+                continue
+
+            logging.error(f"Failed to delete document: {error}")
+
+
+class ElasticsearchVectorStore(_BaseElasticsearchVectorStore):
     """Provides functionality to interact with Elasticsearch for storing and querying document embeddings.
 
     Args:
@@ -21,6 +299,14 @@ class ElasticsearchVectorStore:
         distance_strategy (str, optional): Distance strategy for similarity search. Defaults to ``cosine``.
         text_field (str, optional): Name of the field containing text. Defaults to ``text``.
         vector_field (str, optional): Name of the field containing vector embeddings. Defaults to ``embedding``.
+        index_type (str, optional): ``dense_vector`` index type, e.g. ``hnsw``, ``int8_hnsw``, ``int4_hnsw`` or ``bbq_hnsw``. Defaults to the cluster default.
+        m (int, optional): Number of neighbors of each node in the HNSW graph, requires ``index_type``. Defaults to the cluster default.
+        ef_construction (int, optional): Number of candidates tracked while building the HNSW graph, requires ``index_type``. Defaults to the cluster default.
+        num_candidates (int, optional): Default number of kNN candidates per shard, can be overridden per query. Defaults to ``top_k * 10``.
+        number_of_shards (int, optional): Number of primary shards of the index. Defaults to the cluster default.
+        number_of_replicas (int, optional): Number of replicas of the index. Defaults to the cluster default.
+        refresh_interval (str, optional): Index refresh interval, e.g. ``30s``. Defaults to the cluster default.
+        cache (QueryCache, optional): Query result cache, cleared whenever documents are added or deleted.
     """
 
     def __init__(self,
@@ -35,23 +321,42 @@ class ElasticsearchVectorStore:
                  distance_strategy: str = "cosine",
                  text_field: str = "text",
                  vector_field: str = "embedding",
+                 index_type: Optional[str] = None,
+                 m: Optional[int] = None,
+                 ef_construction: Optional[int] = None,
+                 num_candidates: Optional[int] = None,
+                 number_of_shards: Optional[int] = None,
+                 number_of_replicas: Optional[int] = None,
+                 refresh_interval: Optional[str] = None,
+                 cache: Optional[QueryCache] = None,
                  ) -> None:
         try:
             from elasticsearch import Elasticsearch
-            from elasticsearch.helpers import bulk
+            from elasticsearch.helpers import bulk, parallel_bulk, scan, streaming_bulk
 
             self._es_bulk = bulk
+            self._es_scan = scan
+            self._es_parallel_bulk = parallel_bulk
+            self._es_streaming_bulk = streaming_bulk
         except ImportError:
             raise ImportError("elasticsearch package not found, please install it with `pip install elasticsearch`")
 
         #  TO-DO: Add connections types e.g: cloud
-        self._embed_model = embed_model
-        self.index_name = index_name
-        self.batch_size = batch_size
-        self.dims_length = dims_length
-        self.distance_strategy = distance_strategy
-        self.vector_field = vector_field
-        self.text_field = text_field
+        super().__init__(index_name=index_name,
+                         dims_length=dims_length,
+                         embed_model=embed_model,
+                         batch_size=batch_size,
+                         distance_strategy=distance_strategy,
+                         text_field=text_field,
+                         vector_field=vector_field,
+                         index_type=index_type,
+                         m=m,
+                         ef_construction=ef_construction,
+                         num_candidates=num_candidates,
+                         number_of_shards=number_of_shards,
+                         number_of_replicas=number_of_replicas,
+                         refresh_interval=refresh_interval,
+                         cache=cache)
 
         self._client = Elasticsearch(
             hosts=[url],
@@ -64,121 +369,493 @@ class ElasticsearchVectorStore:
         )
 
         try:
-            self._client.info()
+            info = self._client.info()
         except Exception as e:
             logging.error(f"Error connecting to Elasticsearch: {e}")
             raise
 
+        # The `rrf` retriever is available from Elasticsearch 8.14
+        version = tuple(int(v) for v in info["version"]["number"].split(".")[:2])
+        self._server_rrf = version >= (8, 14)
+
     def _create_index_if_not_exists(self) -> None:
         """Creates the Elasticsearch index if it doesn't already exist."""
         if self._client.indices.exists(index=self.index_name):
             logging.info(f"Index {self.index_name} already exists. Skipping creation.")
 
         else:
-            if self.dims_length is None:
-                raise ValueError(
-                    "Cannot create index without specifying dims_length. "
-                    "When the index doesn't already exist."
-                )
-
-            if self.distance_strategy not in ["cosine", "dot_product", "l2_norm"]:
-                raise ValueError(f"Similarity {self.distance_strategy} not supported.")
-
-            index_mappings = {
-                "properties": {
-                    self.text_field: {"type": "text"},
-                    self.vector_field: {
-                        "type": "dense_vector",
-                        "dims": self.dims_length,
-                        "index": True,
-                        "similarity": self.distance_strategy,
-                    },
-                    "metadata": {
-                        "properties": {
-                            "creation_date": {"type": "keyword"},
-                            "filename": {"type": "keyword"},
-                            "file_type": {"type": "keyword"},
-                            "page": {"type": "keyword"},
-                        }
-                    }
-                }
-            }
+            index_mappings = self._build_index_mappings()
 
             print(f"Creating index {self.index_name}")
 
-            self._client.indices.create(index=self.index_name, mappings=index_mappings)
+            self._client.indices.create(index=self.index_name,
+                                        mappings=index_mappings,
+                                        settings=self._build_index_settings() or None)
+
+    @contextmanager
+    def bulk_load(self, refresh_interval: str = "-1", number_of_replicas: int = 0) -> Iterator[None]:
+        """Context manager relaxing the index settings during a bulk load, restoring them and refreshing on exit.
+
+        Args:
+            refresh_interval (str, optional): Refresh interval during the load, ``-1`` disables refreshes. Defaults to ``-1``.
+            number_of_replicas (int, optional): Number of replicas during the load. Defaults to ``0``.
+
+        **Example**
 
-    def add_documents(self, documents: List[Document], create_index_if_not_exists: bool = True) -> None:
+        .. code-block:: python
+
+            with db.bulk_load():
+                db.add_documents(documents, refresh=False)
+        """
+        self._create_index_if_not_exists()
+
+        response = self._client.indices.get_settings(index=self.index_name)
+        relaxed, previous = self._build_bulk_load_settings(response, refresh_interval, number_of_replicas)
+
+        self._client.indices.put_settings(index=self.index_name, settings=relaxed)
+        try:
+            yield
+        finally:
+            self._client.indices.put_settings(index=self.index_name, settings=previous)
+            self._client.indices.refresh(index=self.index_name)
+
+    def add_documents(self, documents: List[Document],
+                      create_index_if_not_exists: bool = True,
+                      thread_count: int = 1,
+                      refresh: bool = True) -> List[dict]:
         """Add documents to the Elasticsearch index.
 
+        Documents are embedded in batches of ``batch_size`` while bulk actions are generated lazily, so embedding
+        overlaps with indexing and the full payload is never held in memory.
+
         Args:
             documents (List[Document]): List of `Document` objects to add to the index.
             create_index_if_not_exists (bool, optional): Whether to create the index if it doesn't exist. Defaults to ``True``.
+            thread_count (int, optional): Number of threads sending bulk requests, ``1`` uses ``streaming_bulk``. Defaults to ``1``.
+            refresh (bool, optional): Whether to refresh the index once all documents are added. Defaults to ``True``.
+
+        Returns:
+            List[dict]: Bulk items that failed to be indexed.
         """
         if create_index_if_not_exists:
             self._create_index_if_not_exists()
 
-        vector_store_data = []
-        for doc in documents:
-            _id = doc.doc_id if doc.doc_id else str(uuid.uuid4())
-            _metadata = doc.get_metadata()
-            vector_store_data.append({
-                "_index": self.index_name,
-                "_id": _id,
-                self.text_field: doc.get_content(),
-                self.vector_field: self._embed_model.get_query_embedding(doc.get_content()),
-                "metadata": _metadata,
-                "metadata.creation_date": _metadata["creation_date"] if _metadata["creation_date"] else None,
-                "metadata.filename": _metadata["filename"] if _metadata["filename"] else None,
-                "metadata.file_type": _metadata["file_type"] if _metadata["file_type"] else None,
-                "metadata.page": _metadata["page"] if _metadata["page"] else None,
-            })
-
-        self._es_bulk(self._client, vector_store_data, chunk_size=self.batch_size, refresh=True)
-        print(f"Added {len(vector_store_data)} documents to `{self.index_name}`")
-
-    def query(self, query: str, top_k: int = 4) -> List[DocumentWithScore]:
+        with invalidate_cache(self._cache):
+            return self._bulk_index(self._generate_actions(documents), thread_count, refresh)
+
+    def _bulk_index(self, actions: Iterator[dict], thread_count: int = 1, refresh: bool = True) -> List[dict]:
+        """Sends index actions through the bulk helpers, returning the failed items."""
+        if thread_count > 1:
+            results = self._es_parallel_bulk(self._client, actions,
+                                             thread_count=thread_count,
+                                             chunk_size=self.batch_size,
+                                             raise_on_error=False,
+                                             raise_on_exception=False)
+        else:
+            results = self._es_streaming_bulk(self._client, actions,
+                                              chunk_size=self.batch_size,
+                                              raise_on_error=False,
+                                              raise_on_exception=False)
+
+        bulk_results = _BulkResults(self.index_name)
+        for ok, item in results:
+            bulk_results.add(ok, item)
+
+        if refresh:
+            self._client.indices.refresh(index=self.index_name)
+
+        return bulk_results.report()
+
+    def _generate_actions(self, documents: List[Document]) -> Iterator[dict]:
+        """Lazily yields bulk index actions, embedding documents one batch at a time."""
+        for i in range(0, len(documents), self.batch_size):
+            batch = documents[i:i + self.batch_size]
+
+            for doc, embedding in zip(batch, self._embed_model.get_documents_embedding(batch)):
+                yield self._to_action(doc, embedding)
+
+    def iter_documents(self, page_size: int = None,
+                       include_vectors: bool = False,
+                       filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                       keep_alive: str = "1m") -> Iterator[Union[Document, Tuple[Document, List[float]]]]:
+        """Iterate over the stored documents with a point in time and ``search_after``.
+
+        The point in time gives a consistent snapshot of the index, unaffected by concurrent writes.
+
+        Args:
+            page_size (int, optional): Number of documents fetched per request. Defaults to ``batch_size``.
+            include_vectors (bool, optional): Whether to yield ``(document, vector)`` pairs. Defaults to ``False``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter on the exported documents.
+            keep_alive (str, optional): How long the point in time is kept between requests. Defaults to ``1m``.
+        """
+        page_size = page_size or self.batch_size
+        filter = to_metadata_filters(filter)
+        query = {"bool": {"filter": [self._to_elasticsearch_filter(filter)]}} if filter else {"match_all": {}}
+
+        pit_id = self._client.open_point_in_time(index=self.index_name, keep_alive=keep_alive)["id"]
+        try:
+            search_after = None
+            while True:
+                response = self._client.search(pit={"id": pit_id, "keep_alive": keep_alive},
+                                               query=query,
+                                               size=page_size,
+                                               sort=[{"_shard_doc": "asc"}],
+                                               search_after=search_after,
+                                               _source=True if include_vectors else {"excludes": [self.vector_field]})
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+
+                for hit in hits:
+                    doc = Document(doc_id=hit["_id"],
+                                   text=hit["_source"][self.text_field],
+                                   metadata=hit["_source"].get("metadata"))
+
+                    yield (doc, hit["_source"][self.vector_field]) if include_vectors else doc
+
+                if len(hits) < page_size:
+                    break
+
+                search_after = hits[-1]["sort"]
+        finally:
+            self._client.close_point_in_time(id=pit_id)
+
+    def reindex_to(self, new_store: "ElasticsearchVectorStore",
+                   page_size: int = None,
+                   thread_count: int = 1) -> List[dict]:
+        """Copy every document and its stored vector to another store, without calling the embedding model.
+
+        Useful to change the index mappings, e.g. the ``index_type``, of an existing corpus.
+
+        Args:
+            new_store (ElasticsearchVectorStore): Destination store, with the same ``dims_length``.
+            page_size (int, optional): Number of documents read per request. Defaults to ``batch_size``.
+            thread_count (int, optional): Number of threads sending bulk requests to the destination. Defaults to ``1``.
+
+        Returns:
+            List[dict]: Bulk items that failed to be indexed.
+        """
+        if new_store.dims_length != self.dims_length:
+            raise ValueError(f"Cannot reindex vectors of {self.dims_length} dimensions "
+                             f"to a store of {new_store.dims_length} dimensions.")
+
+        if new_store.index_name == self.index_name and new_store._client is self._client:
+            raise ValueError("Cannot reindex a store to itself.")
+
+        new_store._create_index_if_not_exists()
+        with invalidate_cache(new_store._cache):
+            actions = (new_store._to_action(doc, vector)
+                       for doc, vector in self.iter_documents(page_size=page_size, include_vectors=True))
+
+            return new_store._bulk_index(actions, thread_count)
+
+    def upsert_documents(self, documents: List[Document],
+                         source_key: str = "filename",
+                         delete_orphans: bool = True,
+                         thread_count: int = 1) -> Dict[str, List[str]]:
+        """Incrementally add documents, embedding and writing only the new or changed ones.
+
+        Stored versions are fetched in bulk with ``mget`` and compared by content fingerprint (see `Document.hash`),
+        so documents need stable IDs, e.g. from `Document.with_content_id`. Stored documents sharing a source with
+        the incoming ones, but absent from them, are deleted as orphans, except for sources with failed documents.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to upsert.
+            source_key (str, optional): Metadata key identifying the source of a document. Defaults to ``filename``.
+            delete_orphans (bool, optional): Whether to delete orphaned documents of the same sources. Defaults to ``True``.
+            thread_count (int, optional): Number of threads sending bulk requests. Defaults to ``1``.
+
+        Returns:
+            Dict[str, List[str]]: IDs ``added``, ``updated``, ``unchanged``, ``failed`` and ``deleted``.
+        """
+        self._create_index_if_not_exists()
+
+        stored_hashes = {}
+        for i in range(0, len(documents), self.batch_size):
+            response = self._client.mget(index=self.index_name,
+                                         ids=[doc.doc_id for doc in documents[i:i + self.batch_size]],
+                                         source_excludes=[self.vector_field])
+
+            for hit in response["docs"]:
+                if hit.get("found"):
+                    stored_hashes[hit["_id"]] = Document(text=hit["_source"][self.text_field],
+                                                         metadata=hit["_source"].get("metadata")).hash
+
+        changed, result = diff_documents(documents, stored_hashes)
+
+        failed_ids = set()
+        if changed:
+            failed = self.add_documents(changed, create_index_if_not_exists=False, thread_count=thread_count)
+            failed_ids = {error.get("_id") for item in failed for error in item.values()}
+
+        result["added"] = [_id for _id in result["added"] if _id not in failed_ids]
+        result["updated"] = [_id for _id in result["updated"] if _id not in failed_ids]
+        result["failed"] = [doc.doc_id for doc in changed if doc.doc_id in failed_ids]
+
+        # Stored documents of a partially written source are kept, so it can be upserted again
+        failed_sources = set(get_sources([doc for doc in changed if doc.doc_id in failed_ids], source_key))
+        sources = [source for source in get_sources(documents, source_key) if source not in failed_sources]
+
+        result["deleted"] = []
+        if delete_orphans and sources:
+            ids = {doc.doc_id for doc in documents}
+            hits = self._es_scan(self._client,
+                                 index=self.index_name,
+                                 query={"query": {"terms": {f"metadata.{source_key}": sources}}},
+                                 _source=False)
+
+            result["deleted"] = [hit["_id"] for hit in hits if hit["_id"] not in ids]
+            if result["deleted"]:
+                self.delete_documents(result["deleted"])
+
+        return result
+
+    def query(self, query: str, top_k: int = 4,
+              filter: Union[MetadataFilters, Dict[str, Any]] = None,
+              num_candidates: Optional[int] = None) -> List[DocumentWithScore]:
         """Performs a similarity search for top-k most similar documents.
 
         Args:
             query (str): Query text.
             top_k (int, optional): Number of top results to return. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied inside the kNN search.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
         """
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k, filter, num_candidates=num_candidates)
+            if cached is not None:
+                return cached
+
         query_embedding = self._embed_model.get_query_embedding(query)
-        #  TO-DO: Add elasticsearch `filter` option
-        es_query = {"knn": {
-            # "filter": filter,
-            "field": self.vector_field,
-            "query_vector": query_embedding,
-            "k": top_k,
-            "num_candidates": top_k * 10,
-        }}
+
+        if self._cache is not None:
+            cached = self._cache.get_similar(query_embedding, top_k, filter, num_candidates=num_candidates)
+            if cached is not None:
+                return cached
 
         results = self._client.search(index=self.index_name,
-                                      **es_query,
-                                      size=top_k,
-                                      _source={"excludes": [self.vector_field]})
+                                      **self._build_search_body(query_embedding, top_k, filter, num_candidates))
+        docs_and_scores = self._to_documents_with_score(results["hits"]["hits"])
 
-        hits = results["hits"]["hits"]
+        if self._cache is not None:
+            self._cache.put(query, top_k, filter, docs_and_scores, query_embedding, num_candidates=num_candidates)
 
-        return [DocumentWithScore(
-            document=Document(
-                doc_id=hit["_id"],
-                text=hit["_source"]["text"],
-                metadata=hit["_source"]["metadata"],
-            ),
-            score=hit["_score"])
-            for hit in hits
-        ]
+        return docs_and_scores
 
-    def delete_documents(self, ids: List[str] = None) -> None:
-        """Delete documents from the Elasticsearch index.
+    def query_batch(self, queries: List[str], top_k: int = 4,
+                    filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                    num_candidates: Optional[int] = None) -> List[List[DocumentWithScore]]:
+        """Performs a similarity search for several queries in a single ``_msearch`` request.
+
+        Args:
+            queries (List[str]): List of query texts.
+            top_k (int, optional): Number of top results to return per query. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied to every query.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+
+        Returns:
+            List[List[DocumentWithScore]]: Results of each query, in the order of ``queries``.
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self._embed_model.get_texts_embedding(queries)
+        searches = self._build_msearch_body(query_embeddings, top_k, filter, num_candidates)
+
+        responses = self._client.msearch(searches=searches)["responses"]
+
+        return self._parse_msearch_responses(queries, responses)
+
+    def max_marginal_relevance_search(self, query: str, top_k: int = 4,
+                                      fetch_k: int = 20,
+                                      lambda_mult: float = 0.5,
+                                      filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                                      num_candidates: Optional[int] = None) -> List[DocumentWithScore]:
+        """Performs a Maximal Marginal Relevance (MMR) search, trading similarity to the query for diversity.
+
+        The ``fetch_k`` candidates are retrieved together with their vectors in a single kNN search.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of results to return. Defaults to ``4``.
+            fetch_k (int, optional): Number of candidates to select from. Defaults to ``20``.
+            lambda_mult (float, optional): Trade-off between relevance (``1``) and diversity (``0``). Defaults to ``0.5``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied inside the kNN search.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+        """
+        query_embedding = self._embed_model.get_query_embedding(query)
+
+        body = self._build_search_body(query_embedding, max(fetch_k, top_k), filter, num_candidates)
+        body["_source"] = True
+
+        results = self._client.search(index=self.index_name, **body)
+
+        return self._select_mmr_hits(query_embedding, results["hits"]["hits"], top_k, lambda_mult)
+
+    def hybrid_query(self, query: str, top_k: int = 4,
+                     filter: Union[MetadataFilters, Dict[str, Any]] = None,
+                     text_weight: float = 1.0,
+                     knn_weight: float = 1.0,
+                     text_candidates: int = None,
+                     knn_candidates: int = None,
+                     num_candidates: Optional[int] = None,
+                     rank_constant: int = 60,
+                     rrf: Literal["auto", "server", "client"] = "auto") -> List[DocumentWithScore]:
+        """Performs a hybrid search, combining a BM25 ``match`` on ``text_field`` with a kNN search in a single request.
+
+        Both rankings are fused with Reciprocal Rank Fusion (RRF). The fusion runs server-side through the ``rrf``
+        retriever when the cluster supports it and the weights are equal, otherwise both legs are sent in one
+        ``_msearch`` request and fused client-side.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of top results to return. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied to both legs.
+            text_weight (float, optional): RRF weight of the BM25 leg. Defaults to ``1.0``.
+            knn_weight (float, optional): RRF weight of the kNN leg. Defaults to ``1.0``.
+            text_candidates (int, optional): Number of BM25 candidates to fuse. Defaults to ``top_k * 5``.
+            knn_candidates (int, optional): Number of kNN candidates to fuse. Defaults to ``top_k * 5``.
+            num_candidates (int, optional): Number of kNN candidates per shard, trading latency for recall.
+            rank_constant (int, optional): RRF rank constant, higher values flatten the rank contribution. Defaults to ``60``.
+            rrf (str, optional): Where to fuse ranks, ``auto``, ``server`` or ``client``. Defaults to ``auto``.
+        """
+        from elasticsearch import ApiError
+
+        text_candidates = text_candidates or top_k * 5
+        knn_candidates = knn_candidates or top_k * 5
+        query_embedding = self._embed_model.get_query_embedding(query)
+        filter = to_metadata_filters(filter)
+
+        text_query = {"bool": {"must": [{"match": {self.text_field: query}}]}}
+        if filter:
+            text_query["bool"]["filter"] = [self._to_elasticsearch_filter(filter)]
+
+        knn = self._build_search_body(query_embedding, knn_candidates, filter, num_candidates)["knn"]
+
+        use_server = rrf == "server" or (rrf == "auto" and self._server_rrf and text_weight == knn_weight)
+        if use_server:
+            try:
+                results = self._client.search(index=self.index_name,
+                                              retriever={"rrf": {
+                                                  "retrievers": [{"standard": {"query": text_query}}, {"knn": knn}],
+                                                  "rank_window_size": max(text_candidates, knn_candidates, top_k),
+                                                  "rank_constant": rank_constant,
+                                              }},
+                                              size=top_k,
+                                              _source={"excludes": [self.vector_field]})
+
+                return self._to_documents_with_score(results["hits"]["hits"])
+            except ApiError as e:
+                if rrf == "server":
+                    raise
+
+                logging.warning(f"Server-side RRF not available, falling back to client-side fusion: {e}")
+                self._server_rrf = False
+
+        responses = self._client.msearch(searches=[
+            {"index": self.index_name},
+            {"query": text_query, "size": text_candidates, "_source": {"excludes": [self.vector_field]}},
+            {"index": self.index_name},
+            {"knn": knn, "size": knn_candidates, "_source": {"excludes": [self.vector_field]}},
+        ])["responses"]
+
+        for response in responses:
+            if "error" in response:
+                raise ValueError(f"Error searching `{query}`: {response['error']}")
+
+        fused = self._reciprocal_rank_fusion([response["hits"]["hits"] for response in responses],
+                                             weights=[text_weight, knn_weight],
+                                             rank_constant=rank_constant)
+
+        return [DocumentWithScore(document=doc.document, score=score)
+                for doc, score in fused[:top_k]]
+
+    def _reciprocal_rank_fusion(self, rankings: List[List[dict]],
+                                weights: List[float],
+                                rank_constant: int) -> List[tuple]:
+        """Fuses ranked hit lists, scoring each document with ``sum(weight / (rank_constant + rank))``."""
+        scores = {}
+        documents = {}
+        for hits, weight in zip(rankings, weights):
+            for rank, doc in enumerate(self._to_documents_with_score(hits), start=1):
+                scores[doc.doc_id] = scores.get(doc.doc_id, 0.0) + weight / (rank_constant + rank)
+                documents.setdefault(doc.doc_id, doc)
+
+        return sorted(((documents[_id], score) for _id, score in scores.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    def delete_documents(self, ids: List[str] = None, refresh: bool = True) -> None:
+        """Delete documents from the Elasticsearch index through the bulk API.
 
         Args:
             ids (List[str]): List of `Document` IDs to delete.
+            refresh (bool, optional): Whether to refresh the index once all documents are deleted. Defaults to ``True``.
         """
         if not ids:
             raise ValueError("No ids provided to delete.")
 
-        for id in ids:
-            self._client.delete(index=self.index_name, id=id)
+        with invalidate_cache(self._cache):
+            actions = ({"_op_type": "delete", "_index": self.index_name, "_id": _id} for _id in ids)
+
+            _, errors = self._es_bulk(self._client, actions,
+                                      chunk_size=self.batch_size,
+                                      raise_on_error=False,
+                                      refresh=refresh)
+
+        self._log_delete_errors(errors)
+
+    def delete_by_metadata(self, filter: Union[MetadataFilters, Dict[str, Any]],
+                           slices: Union[int, str] = "auto",
+                           poll_interval: float = 1.0,
+                           timeout: Optional[float] = None) -> int:
+        """Delete all documents matching metadata values, e.g. every chunk of a source file.
+
+        The deletion runs as an asynchronous sliced ``_delete_by_query`` task, polled until it completes. A task
+        that fails, or fails to delete some documents, raises a ``RuntimeError``.
+
+        Args:
+            filter (MetadataFilters | Dict[str, Any]): Metadata filter, or key/value pairs to match where a list
+                value matches any of its items, e.g. ``{"source": "./data/report.pdf"}``. String values are mapped as
+                ``keyword`` in indices created by this store.
+            slices (int | str, optional): Number of slices to parallelize the deletion. Defaults to ``auto``.
+            poll_interval (float, optional): Seconds between task status checks. Defaults to ``1.0``.
+            timeout (float, optional): Seconds to wait for the task before raising a ``TimeoutError``, the task
+                keeps running in the cluster. Defaults to ``None`` (no limit).
+
+        Returns:
+            int: Number of deleted documents.
+        """
+        if not filter:
+            raise ValueError("No filter provided to delete.")
+
+        with invalidate_cache(self._cache):
+            response = self._client.delete_by_query(index=self.index_name,
+                                                    query=self._to_elasticsearch_filter(to_metadata_filters(filter)),
+                                                    slices=slices,
+                                                    conflicts="proceed",
+                                                    refresh=True,
+                                                    wait_for_completion=False)
+            task_id = response["task"]
+
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            while True:
+                task = self._client.tasks.get(task_id=task_id)
+                if task["completed"]:
+                    break
+
+                if deadline is not None and time.monotonic() + poll_interval > deadline:
+                    raise TimeoutError(f"Delete by query task {task_id} did not complete within {timeout}s.")
+
+                time.sleep(poll_interval)
+
+            if task.get("error"):
+                raise RuntimeError(f"Delete by query task {task_id} failed: {task['error']}")
+
+            result = task.get("response", {})
+            for failure in result.get("failures", []):
+                logging.error(f"Failed to delete document: {failure}")
+
+            if result.get("failures"):
+                raise RuntimeError(f"Failed to delete {len(result['failures'])} documents from `{self.index_name}`, "
+                                   f"{result.get('deleted', 0)} were deleted.")
+
+            return result.get("deleted", 0)
@@ -0,0 +1,276 @@
+import os
+import json
+import uuid
+
+from typing import Any, Dict, List, Optional, Union
+from deeptxt.core.document import Document, DocumentWithScore
+from deeptxt.core.embeddings import BaseEmbedding
+from deeptxt.core.vector_stores import HNSWIndex, QueryCache
+from deeptxt.core.vector_stores.cache import invalidate_cache
+from deeptxt.core.vector_stores.filters import MetadataFilters, to_metadata_filters
+from deeptxt.core.vector_stores.utils import diff_documents, get_sources, maximal_marginal_relevance
+
+
+class HNSWVectorStore:
+    """Local in-process vector store backed by a NumPy HNSW index, no database required.
+
+    Args:
+        embed_model (BaseEmbedding):
+        distance_strategy (str, optional): Distance strategy for similarity search. Defaults to ``cosine``.
+        M (int, optional): Maximum number of links per element of the HNSW graph. Defaults to ``16``.
+        ef_construction (int, optional): Size of the dynamic candidate list during insertion. Defaults to ``200``.
+        ef_search (int, optional): Size of the dynamic candidate list during search. Defaults to ``50``.
+        cache (QueryCache, optional): Query result cache, cleared whenever documents are added or deleted.
+
+    **Example**
+
+    .. code-block:: python
+
+        from deeptxt.embeddings import HuggingFaceEmbedding
+        from deeptxt.vector_stores import HNSWVectorStore
+
+        embedding = HuggingFaceEmbedding()
+        db = HNSWVectorStore(embed_model=embedding)
+    """
+
+    def __init__(self, embed_model: BaseEmbedding,
+                 distance_strategy: str = "cosine",
+                 M: int = 16,
+                 ef_construction: int = 200,
+                 ef_search: int = 50,
+                 cache: Optional[QueryCache] = None) -> None:
+
+        if distance_strategy not in ["cosine", "ip", "l2"]:
+            raise ValueError(f"Similarity {distance_strategy} not supported.")
+
+        self._embed_model = embed_model
+        self.distance_strategy = distance_strategy
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self._cache = cache
+
+        # The index is created on the first insert, once the embedding length is known
+        self._index: Optional[HNSWIndex] = None
+        self._documents: Dict[int, Document] = {}
+        self._labels: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add_documents(self, documents: List[Document]) -> List:
+        """Add documents to the index. Documents with an existing ID replace the stored ones.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to add to the index.
+        """
+        if not documents:
+            return []
+
+        with invalidate_cache(self._cache):
+            embeddings = self._embed_model.get_documents_embedding(documents)
+
+            if self._index is None:
+                self._index = HNSWIndex(dims=len(embeddings[0]),
+                                        space=self.distance_strategy,
+                                        M=self.M,
+                                        ef_construction=self.ef_construction,
+                                        ef_search=self.ef_search)
+
+            ids = []
+            for doc, label in zip(documents, self._index.add_items(embeddings)):
+                _id = doc.doc_id if doc.doc_id else str(uuid.uuid4())
+                if _id in self._labels:
+                    self._remove(_id)
+
+                self._labels[_id] = label
+                self._documents[label] = Document(doc_id=_id, text=doc.get_content(), metadata=doc.get_metadata())
+                ids.append(_id)
+
+            return ids
+
+    def upsert_documents(self, documents: List[Document],
+                         source_key: str = "filename",
+                         delete_orphans: bool = True) -> Dict[str, List[str]]:
+        """Incrementally add documents, embedding and writing only the new or changed ones.
+
+        Documents are compared with their stored version by content fingerprint (see `Document.hash`), so they
+        need stable IDs, e.g. from `Document.with_content_id`. Stored documents sharing a source with the
+        incoming ones, but absent from them, are deleted as orphans.
+
+        Args:
+            documents (List[Document]): List of `Document` objects to upsert.
+            source_key (str, optional): Metadata key identifying the source of a document. Defaults to ``filename``.
+            delete_orphans (bool, optional): Whether to delete orphaned documents of the same sources. Defaults to ``True``.
+
+        Returns:
+            Dict[str, List[str]]: IDs ``added``, ``updated``, ``unchanged`` and ``deleted``.
+        """
+        stored_hashes = {doc.doc_id: self._documents[self._labels[doc.doc_id]].hash
+                         for doc in documents if doc.doc_id in self._labels}
+
+        changed, result = diff_documents(documents, stored_hashes)
+        if changed:
+            self.add_documents(changed)
+
+        result["deleted"] = []
+        sources = get_sources(documents, source_key)
+        if delete_orphans and sources:
+            ids = {doc.doc_id for doc in documents}
+            result["deleted"] = [doc.doc_id for doc in self._documents.values()
+                                 if doc.get_metadata().get(source_key) in sources and doc.doc_id not in ids]
+            if result["deleted"]:
+                self.delete_documents(result["deleted"])
+
+        return result
+
+    def query(self, query: str, top_k: int = 4,
+              filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[DocumentWithScore]:
+        """Performs a similarity search for top-k most similar documents.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of top results to return. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter evaluated during the graph search.
+        """
+        if self._index is None:
+            return []
+
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k, filter)
+            if cached is not None:
+                return cached
+
+        query_embedding = self._embed_model.get_query_embedding(query)
+
+        if self._cache is not None:
+            cached = self._cache.get_similar(query_embedding, top_k, filter)
+            if cached is not None:
+                return cached
+
+        docs_and_scores = self._search(query_embedding, top_k, filter)
+
+        if self._cache is not None:
+            self._cache.put(query, top_k, filter, docs_and_scores, query_embedding)
+
+        return docs_and_scores
+
+    def query_batch(self, queries: List[str], top_k: int = 4,
+                    filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[List[DocumentWithScore]]:
+        """Performs a similarity search for several queries, embedded in a single call.
+
+        Args:
+            queries (List[str]): List of query texts.
+            top_k (int, optional): Number of top results to return per query. Defaults to ``4``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied to every query.
+
+        Returns:
+            List[List[DocumentWithScore]]: Results of each query, in the order of ``queries``.
+        """
+        if not queries or self._index is None:
+            return [[] for _ in queries]
+
+        query_embeddings = self._embed_model.get_texts_embedding(queries)
+
+        return [self._search(query_embedding, top_k, filter) for query_embedding in query_embeddings]
+
+    def max_marginal_relevance_search(self, query: str, top_k: int = 4,
+                                      fetch_k: int = 20,
+                                      lambda_mult: float = 0.5,
+                                      filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[DocumentWithScore]:
+        """Performs a Maximal Marginal Relevance (MMR) search, trading similarity to the query for diversity.
+
+        Args:
+            query (str): Query text.
+            top_k (int, optional): Number of results to return. Defaults to ``4``.
+            fetch_k (int, optional): Number of candidates to select from. Defaults to ``20``.
+            lambda_mult (float, optional): Trade-off between relevance (``1``) and diversity (``0``). Defaults to ``0.5``.
+            filter (MetadataFilters | Dict[str, Any], optional): Metadata filter applied during the graph search.
+        """
+        if self._index is None:
+            return []
+
+        query_embedding = self._embed_model.get_query_embedding(query)
+        docs_and_scores = self._search(query_embedding, max(fetch_k, top_k), filter)
+        if not docs_and_scores:
+            return []
+
+        embeddings = self._index.get_items([self._labels[doc.document.doc_id] for doc in docs_and_scores])
+        selected = maximal_marginal_relevance(query_embedding, embeddings, top_k, lambda_mult)
+
+        return [docs_and_scores[i] for i in selected]
+
+    def _search(self, query_embedding: List[float], top_k: int,
+                filter: Union[MetadataFilters, Dict[str, Any]] = None) -> List[DocumentWithScore]:
+        filter = to_metadata_filters(filter)
+        labels, distances = self._index.knn_query(
+            query_embedding, k=top_k,
+            filter=(lambda label: filter.matches(self._documents[label].get_metadata())) if filter else None)
+
+        return [DocumentWithScore(document=self._documents[label], score=float(distance))
+                for label, distance in zip(labels.tolist(), distances.tolist())]
+
+    def delete_documents(self, ids: List[str] = None) -> None:
+        """Delete documents from the index.
+
+        Args:
+            ids (List[str]): List of `Document` IDs to delete. Defaults to ``None``.
+        """
+        if not ids:
+            raise ValueError("No ids provided to delete.")
+
+        with invalidate_cache(self._cache):
+            for _id in ids:
+                if _id in self._labels:
+                    self._remove(_id)
+
+    def _remove(self, _id: str) -> None:
+        label = self._labels.pop(_id)
+        self._documents.pop(label)
+        self._index.mark_deleted(label)
+
+    def save(self, persist_dir: str) -> None:
+        """Save the index and its documents to a directory.
+
+        Args:
+            persist_dir (str): Directory path.
+        """
+        os.makedirs(persist_dir, exist_ok=True)
+
+        config = {
+            "distance_strategy": self.distance_strategy,
+            "M": self.M,
+            "ef_construction": self.ef_construction,
+            "ef_search": self.ef_search,
+        }
+        documents = [{"label": label, "doc_id": doc.doc_id, "text": doc.text, "metadata": doc.metadata}
+                     for label, doc in self._documents.items()]
+
+        with open(os.path.join(persist_dir, "documents.json"), "w", encoding="utf-8") as f:
+            json.dump({"config": config, "documents": documents}, f)
+
+        if self._index is not None:
+            self._index.save(os.path.join(persist_dir, "index.npz"))
+
+    @classmethod
+    def load(cls, persist_dir: str, embed_model: BaseEmbedding) -> "HNSWVectorStore":
+        """Load a vector store saved with :meth:`save`.
+
+        Args:
+            persist_dir (str): Directory path.
+            embed_model (BaseEmbedding):
+        """
+        with open(os.path.join(persist_dir, "documents.json"), encoding="utf-8") as f:
+            persisted = json.load(f)
+
+        store = cls(embed_model=embed_model, **persisted["config"])
+
+        index_path = os.path.join(persist_dir, "index.npz")
+        if os.path.isfile(index_path):
+            store._index = HNSWIndex.load(index_path)
+
+        for doc in persisted["documents"]:
+            store._labels[doc["doc_id"]] = doc["label"]
+            store._documents[doc["label"]] = Document(doc_id=doc["doc_id"], text=doc["text"], metadata=doc["metadata"])
+
+        return store